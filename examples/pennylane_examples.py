@@ -10,7 +10,6 @@ Run these examples with:
     manim -pql examples/pennylane_examples.py UsingPennylaneWithParameter
 """
 from manim import PI, DOWN, UP, Scene, ValueTracker, Write
-import pennylane as qml
 
 from manim_quantum import (
     CircuitEvaluationAnimation,
@@ -29,6 +28,8 @@ class UsingPennylane(Scene):
     - Animating the circuit with glow effects
     """
     def construct(self):
+        import pennylane as qml
+
         dev = qml.device("default.qubit", wires=2)
 
         @qml.qnode(dev)
@@ -57,6 +58,8 @@ class UsingPennylaneWithParameter(Scene):
     - Smooth animation of parameter values from 0.5 to π to 0
     """
     def construct(self):
+        import pennylane as qml
+
         dev = qml.device("default.qubit", wires=2)
 
         @qml.qnode(dev)
@@ -71,8 +74,21 @@ class UsingPennylaneWithParameter(Scene):
         sv = StateVector(my_circuit(theta.get_value()), show_probabilities=True)
         sv.move_to(DOWN)
 
-        circuit.add_updater(lambda m: m.become(circuit_from_qnode(my_circuit, theta.get_value()).move_to(UP)))
-        sv.add_updater(lambda m: m.become(StateVector(my_circuit(theta.get_value()), show_probabilities=True).move_to(DOWN)))
+        # Only the RY label is re-rendered; the rest of the circuit is kept as is
+        circuit.add_updater(lambda m: m.set_parameter("theta", theta.get_value()))
+
+        # Evaluate the QNode at most once per distinct theta; frames where theta
+        # does not change (e.g. during waits) reuse the current state vector
+        last_theta = [theta.get_value()]
+
+        def update_state(m):
+            value = theta.get_value()
+            if value == last_theta[0]:
+                return
+            last_theta[0] = value
+            m.become(StateVector(my_circuit(value), show_probabilities=True).move_to(DOWN))
+
+        sv.add_updater(update_state)
 
         self.play(Write(circuit), Write(sv))
         self.wait(0.5)
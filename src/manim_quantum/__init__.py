@@ -2,30 +2,75 @@
 
 This library provides tools for creating beautiful animations of quantum
 circuits, state vectors, Bloch spheres, and other quantum computing concepts.
+
+The public classes are imported lazily on first access (PEP 562), so a
+bare ``import manim_quantum`` does not import Manim or any subpackage. The
+first access to a name, e.g. ``from manim_quantum import QuantumCircuit``,
+imports its subpackage and with it Manim itself, which is the bulk of the
+import time. Subpackages that are never used (such as the PennyLane
+integration) are never imported.
 """
 
 from __future__ import annotations
 
-# Animations
-from manim_quantum.animations import (
-    GateAnimation,
-    CircuitEvaluationAnimation,
-    BlochSphereStateTransition,
-    BlochSphereRotation,
-)
-# Bloch sphere
-from manim_quantum.bloch import BlochSphere
-# Circuit components
-from manim_quantum.circuits import QuantumCircuit, QuantumGate, QuantumWire
-# PennyLane integration
-from manim_quantum.pennylane import circuit_from_qnode
-# State representations
-from manim_quantum.states import StateVector, KetLabel
-# Styles
-from manim_quantum.styles import QuantumStyle, StylePresets
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Animations
+    from manim_quantum.animations import (
+        GateAnimation,
+        CircuitEvaluationAnimation,
+        BlochSphereStateTransition,
+        BlochSphereRotation,
+    )
+    # Bloch sphere
+    from manim_quantum.bloch import BlochSphere
+    # Circuit components
+    from manim_quantum.circuits import QuantumCircuit, QuantumGate, QuantumWire
+    # PennyLane integration
+    from manim_quantum.pennylane import circuit_from_qnode
+    # State representations
+    from manim_quantum.states import StateVector, KetLabel
+    # Styles
+    from manim_quantum.styles import QuantumStyle, StylePresets
 
 __version__ = "0.1.0"
 
+# Subpackage that provides each public name
+_LAZY_EXPORTS = {
+    "QuantumCircuit": "manim_quantum.circuits",
+    "QuantumGate": "manim_quantum.circuits",
+    "QuantumWire": "manim_quantum.circuits",
+    "BlochSphere": "manim_quantum.bloch",
+    "StateVector": "manim_quantum.states",
+    "KetLabel": "manim_quantum.states",
+    "GateAnimation": "manim_quantum.animations",
+    "CircuitEvaluationAnimation": "manim_quantum.animations",
+    "BlochSphereStateTransition": "manim_quantum.animations",
+    "BlochSphereRotation": "manim_quantum.animations",
+    "QuantumStyle": "manim_quantum.styles",
+    "StylePresets": "manim_quantum.styles",
+    "circuit_from_qnode": "manim_quantum.pennylane",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its subpackage on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names alongside the module attributes."""
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     # Circuits
     "QuantumCircuit",
@@ -0,0 +1,84 @@
+"""Cache of rendered MathTex labels and label placement shared by all components."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+from manim import ORIGIN, MathTex, Mobject
+
+if TYPE_CHECKING:
+    from manim.typing import Point3DLike, Vector3D
+    from manim.utils.color import ParsableManimColor
+
+
+# Rendered labels by LaTeX source, least recently used first
+_TEX_CACHE: OrderedDict[str, MathTex] = OrderedDict()
+_TEX_CACHE_SIZE = 512
+
+
+def _tex_prototype(tex: str) -> MathTex:
+    """Render a LaTeX string once and keep the result as a prototype."""
+    prototype = _TEX_CACHE.get(tex)
+    if prototype is None:
+        prototype = _TEX_CACHE[tex] = MathTex(tex)
+        if len(_TEX_CACHE) > _TEX_CACHE_SIZE:
+            _TEX_CACHE.popitem(last=False)
+    else:
+        _TEX_CACHE.move_to_end(tex)
+    return prototype
+
+
+def cached_math_tex(tex: str, color: ParsableManimColor | None = None) -> MathTex:
+    r"""
+    Create a MathTex label by copying a cached rendering of the same string.
+
+    Rendering a MathTex runs the LaTeX -> SVG -> Bezier pipeline, while a
+    copy only duplicates the point arrays. The prototypes are never handed
+    out, so callers are free to modify the returned label.
+
+    Args:
+        tex: LaTeX source of the label.
+        color: Optional color for the label.
+
+    Returns:
+        A new MathTex mobject.
+
+    Example:
+        >>> label = cached_math_tex(r"|0\rangle", color=WHITE)
+    """
+    label = _tex_prototype(tex).copy()
+    if color is not None:
+        label.set_color(color)
+    return label
+
+
+def place_scaled(
+        mobject: Mobject, scale_factor: float, target: Point3DLike, edge: Vector3D = ORIGIN
+) -> Mobject:
+    """
+    Scale a label and move one of its edges (or its center) onto a point.
+
+    This is equivalent to scale() followed by move_to() / next_to(), but
+    only passes over the points once: scaling about the fixed point
+    P = (target - s * anchor) / (1 - s) carries the anchor straight onto
+    the target.
+
+    Args:
+        mobject: Mobject to place.
+        scale_factor: Scale factor to apply.
+        target: Point the anchor ends up on.
+        edge: Direction of the anchor (ORIGIN for the center, RIGHT for the
+            middle of the right edge, ...).
+
+    Returns:
+        The mobject, for chaining.
+    """
+    anchor = mobject.get_critical_point(edge)
+    target = np.asarray(target, dtype=float)
+    if scale_factor == 1:
+        return mobject.shift(target - anchor)
+    about_point = (target - scale_factor * anchor) / (1 - scale_factor)
+    return mobject.scale(scale_factor, about_point=about_point)
+
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -10,6 +11,41 @@ from manim import Animation
 if TYPE_CHECKING:
     from manim_quantum.bloch.sphere import BlochSphere
 
+# Unit vectors for the supported rotation axes
+_AXIS_VECTORS = {
+    "x": (1.0, 0.0, 0.0),
+    "y": (0.0, 1.0, 0.0),
+    "z": (0.0, 0.0, 1.0),
+}
+
+
+def _to_cartesian(theta: float, phi: float) -> tuple[float, float, float]:
+    """Convert Bloch angles to a unit vector."""
+    sin_theta = math.sin(theta)
+    return sin_theta * math.cos(phi), sin_theta * math.sin(phi), math.cos(theta)
+
+
+def _to_spherical(x: float, y: float, z: float) -> tuple[float, float]:
+    """Convert a unit vector back to Bloch angles."""
+    return math.acos(max(-1.0, min(1.0, z))), math.atan2(y, x)
+
+
+def _slerp_to_spherical(
+        v0: tuple[float, float, float],
+        v1: tuple[float, float, float],
+        sin_omega: float,
+        omega: float,
+        alpha: float,
+) -> tuple[float, float]:
+    """Spherically interpolate between two unit vectors and return Bloch angles."""
+    a = math.sin((1.0 - alpha) * omega) / sin_omega
+    b = math.sin(alpha * omega) / sin_omega
+    return _to_spherical(
+        a * v0[0] + b * v1[0],
+        a * v0[1] + b * v1[1],
+        a * v0[2] + b * v1[2],
+    )
+
 
 class BlochSphereStateTransition(Animation):
     """
@@ -44,17 +80,69 @@ class BlochSphereStateTransition(Animation):
         self.initial_phi = bloch_sphere.get_phi()
         self.target_theta = float(target_theta)
         self.target_phi = float(target_phi)
+
+        # Precompute the great circle between both states once
+        self._v0 = _to_cartesian(self.initial_theta, self.initial_phi)
+        self._v1 = _to_cartesian(self.target_theta, self.target_phi)
+        cos_omega = sum(a * b for a, b in zip(self._v0, self._v1))
+        self._omega = math.acos(max(-1.0, min(1.0, cos_omega)))
+        self._sin_omega = math.sin(self._omega)
+
         super().__init__(bloch_sphere, run_time=run_time, **kwargs)
 
     def interpolate_mobject(self, alpha: float) -> None:
         """Interpolate the state along the sphere surface."""
-        # Linear interpolation in spherical coordinates
-        theta = self.initial_theta + alpha * (self.target_theta - self.initial_theta)
-        phi = self.initial_phi + alpha * (self.target_phi - self.initial_phi)
+        if alpha >= 1.0:
+            self.bloch_sphere.set_state(self.target_theta, self.target_phi)
+            return
+
+        if self._sin_omega < 1e-8:
+            # Identical or antipodal states: the great circle is not unique,
+            # so interpolate the angles directly (a meridian for equal phi)
+            theta = self.initial_theta + alpha * (self.target_theta - self.initial_theta)
+            phi = self.initial_phi + alpha * (self.target_phi - self.initial_phi)
+        else:
+            # Spherical linear interpolation
+            theta, phi = _slerp_to_spherical(
+                self._v0, self._v1, self._sin_omega, self._omega, alpha
+            )
 
         # Update the Bloch sphere state
         self.bloch_sphere.set_state(theta, phi)
 
+    def angles_at(self, alphas) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the Bloch angles of the transition at many points at once.
+
+        This is the vectorized counterpart of interpolate_mobject(), useful
+        for sampling the whole path (e.g. to draw its trace) without
+        stepping the sphere through it.
+
+        Args:
+            alphas: Animation progress value(s) between 0 and 1.
+
+        Returns:
+            Tuple (theta, phi) of arrays with the shape of alphas.
+        """
+        alphas = np.asarray(alphas, dtype=float)
+
+        if self._sin_omega < 1e-8:
+            theta = self.initial_theta + alphas * (self.target_theta - self.initial_theta)
+            phi = self.initial_phi + alphas * (self.target_phi - self.initial_phi)
+        else:
+            a = np.sin((1.0 - alphas) * self._omega) / self._sin_omega
+            b = np.sin(alphas * self._omega) / self._sin_omega
+            (x0, y0, z0), (x1, y1, z1) = self._v0, self._v1
+            theta = np.arccos(np.clip(a * z0 + b * z1, -1.0, 1.0))
+            phi = np.arctan2(a * y0 + b * y1, a * x0 + b * x1)
+
+        # The animation snaps to the exact target at its end
+        done = alphas >= 1.0
+        return (
+            np.where(done, self.target_theta, theta),
+            np.where(done, self.target_phi, phi),
+        )
+
 
 class BlochSphereRotation(Animation):
     """
@@ -92,51 +180,44 @@ class BlochSphereRotation(Animation):
         self.initial_theta = bloch_sphere.get_theta()
         self.initial_phi = bloch_sphere.get_phi()
 
+        axis_vector = _AXIS_VECTORS.get(self.axis)
+        if axis_vector is None:
+            raise ValueError(f"Invalid axis: {self.axis}. Must be 'x', 'y', or 'z'.")
+
+        # Split the initial vector into the parts parallel and perpendicular to
+        # the axis, so each rotation only needs one sin/cos pair (Rodrigues' formula)
+        kx, ky, kz = axis_vector
+        x0, y0, z0 = _to_cartesian(self.initial_theta, self.initial_phi)
+        k_dot_v = kx * x0 + ky * y0 + kz * z0
+        self._v_par = (k_dot_v * kx, k_dot_v * ky, k_dot_v * kz)
+        self._v_perp = (x0 - self._v_par[0], y0 - self._v_par[1], z0 - self._v_par[2])
+        self._k_cross_v = (ky * z0 - kz * y0, kz * x0 - kx * z0, kx * y0 - ky * x0)
+
         # Calculate target state based on rotation
         self.target_theta, self.target_phi = self._calculate_rotation()
 
         super().__init__(bloch_sphere, run_time=run_time, **kwargs)
 
+    def _rotate(self, angle: float) -> tuple[float, float]:
+        """Rotate the initial state about the axis and return Bloch angles."""
+        c = math.cos(angle)
+        s = math.sin(angle)
+        # Rotations preserve the unit norm, so no renormalization is needed
+        return _to_spherical(*(
+            p + c * q + s * r
+            for p, q, r in zip(self._v_par, self._v_perp, self._k_cross_v)
+        ))
+
     def _calculate_rotation(self) -> tuple[float, float]:
         """Calculate the target state after rotation."""
-        # Convert initial spherical to Cartesian
-        x0 = np.sin(self.initial_theta) * np.cos(self.initial_phi)
-        y0 = np.sin(self.initial_theta) * np.sin(self.initial_phi)
-        z0 = np.cos(self.initial_theta)
-
-        # Apply rotation matrix
-        c = np.cos(self.angle)
-        s = np.sin(self.angle)
-
-        if self.axis == "x":
-            x1 = x0
-            y1 = c * y0 - s * z0
-            z1 = s * y0 + c * z0
-        elif self.axis == "y":
-            x1 = c * x0 + s * z0
-            y1 = y0
-            z1 = -s * x0 + c * z0
-        elif self.axis == "z":
-            x1 = c * x0 - s * y0
-            y1 = s * x0 + c * y0
-            z1 = z0
-        else:
-            raise ValueError(f"Invalid axis: {self.axis}. Must be 'x', 'y', or 'z'.")
-
-        # Convert back to spherical
-        r = np.sqrt(x1 ** 2 + y1 ** 2 + z1 ** 2)
-        if r < 1e-10:
-            return 0.0, 0.0
-
-        theta = np.arccos(np.clip(z1 / r, -1, 1))
-        phi = np.arctan2(y1, x1)
-
-        return float(theta), float(phi)
+        return self._rotate(self.angle)
 
     def interpolate_mobject(self, alpha: float) -> None:
         """Interpolate the rotation."""
-        # Spherical linear interpolation
-        theta = self.initial_theta + alpha * (self.target_theta - self.initial_theta)
-        phi = self.initial_phi + alpha * (self.target_phi - self.initial_phi)
+        if alpha >= 1.0:
+            self.bloch_sphere.set_state(self.target_theta, self.target_phi)
+            return
 
+        # Rotate about the axis by the partial angle
+        theta, phi = self._rotate(alpha * self.angle)
         self.bloch_sphere.set_state(theta, phi)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -12,13 +13,9 @@ from manim import (
     AnimationGroup,
     Circle,
     Dot,
-    FadeIn,
-    FadeOut,
     LaggedStart,
     Line,
-    MoveAlongPath,
     ShowPassingFlash,
-    Succession,
     VGroup,
     linear,
 )
@@ -50,13 +47,80 @@ class GateAnimation(Animation):
     ) -> None:
         self.gate = gate
         self.color = color or BLUE
+        # Scale currently applied relative to the gate's original size
+        self._current_scale = 1.0
         super().__init__(gate, run_time=run_time, **kwargs)
 
     def interpolate_mobject(self, alpha: float) -> None:
         """Interpolate the animation."""
-        # Simple scale pulse effect
-        scale = 1.0 + 0.2 * np.sin(alpha * np.pi)
-        self.mobject.scale(scale / self.mobject.get_height() * self.gate.get_height())
+        # Simple scale pulse effect, applied relative to the original size
+        scale = 1.0 + 0.2 * math.sin(alpha * math.pi)
+        self.mobject.scale(scale / self._current_scale)
+        self._current_scale = scale
+
+
+class _ShotBatch(Animation):
+    """
+    Animation moving a batch of packets along straight wires.
+
+    Each packet fades in, travels from its start to its end point and fades
+    out again. All packets are updated with plain arithmetic in a single
+    interpolate_mobject call, instead of one Succession per wire.
+
+    Args:
+        packets: List of (packet, start, end) tuples.
+        run_time: Duration of a single packet's flight.
+        lag_ratio: Stagger ratio between consecutive packets.
+        **kwargs: Additional arguments for Animation.
+    """
+
+    fade_ratio = 0.15
+
+    def __init__(
+            self,
+            packets: list[tuple[VGroup, np.ndarray, np.ndarray]],
+            run_time: float = 2.0,
+            lag_ratio: float = 0.0,
+            **kwargs,
+    ) -> None:
+        self.packets = packets
+
+        # Fraction of the total time each packet is in flight, and the
+        # offset between the start of consecutive packets
+        self._duration = 1.0 / (1.0 + (len(packets) - 1) * lag_ratio)
+        self._lag = lag_ratio * self._duration
+
+        # Base opacities of all packet parts, scaled by the fade ramp
+        self._opacities = [
+            [
+                (part, part.get_fill_opacity(), part.get_stroke_opacity())
+                for part in packet.family_members_with_points()
+            ]
+            for packet, _, _ in packets
+        ]
+
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(
+            VGroup(*(packet for packet, _, _ in packets)),
+            run_time=run_time / self._duration,
+            remover=True,
+            **kwargs,
+        )
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        """Move and fade all packets for the current frame."""
+        alpha = self.rate_func(alpha)
+        fade = self.fade_ratio
+
+        for i, (packet, start, end) in enumerate(self.packets):
+            local = min(1.0, max(0.0, (alpha - i * self._lag) / self._duration))
+            travel = min(1.0, max(0.0, (local - fade) / (1.0 - 2 * fade)))
+            packet.move_to(start + travel * (end - start))
+
+            opacity = min(1.0, local / fade, (1.0 - local) / fade)
+            for part, fill_opacity, stroke_opacity in self._opacities[i]:
+                part.set_fill(opacity=fill_opacity * opacity, family=False)
+                part.set_stroke(opacity=stroke_opacity * opacity, family=False)
 
 
 class CircuitEvaluationAnimation:
@@ -73,6 +137,26 @@ class CircuitEvaluationAnimation:
     def __init__(self, circuit: "QuantumCircuit") -> None:
         self.circuit = circuit
 
+        # Wire endpoints as (N, 3) arrays, one row per wire, shared by all animations
+        self._wire_rows = {wire_idx: row for row, wire_idx in enumerate(circuit._wires)}
+        ys = np.fromiter(
+            (wire.y for wire in circuit._wires.values()), dtype=float, count=len(circuit._wires)
+        )
+        zeros = np.zeros_like(ys)
+        self._starts = np.column_stack([np.full_like(ys, circuit.x_start), ys, zeros])
+        self._ends = np.column_stack([np.full_like(ys, circuit.x_end), ys, zeros])
+
+        # Glow lines are built and styled once per wire; each glow animation
+        # gets its own copies, so animations never share or restyle them
+        style = getattr(circuit, "style", None)
+        self._glow_color = getattr(style, "glow_color", BLUE)
+        self._glow_lines = {
+            wire_idx: Line(self._starts[row], self._ends[row]).set_stroke(
+                self._glow_color, width=8, opacity=0.7
+            )
+            for wire_idx, row in self._wire_rows.items()
+        }
+
     def create_shot_animation(
             self,
             wires: list[int] | None = None,
@@ -95,17 +179,15 @@ class CircuitEvaluationAnimation:
         style = getattr(self.circuit, "style", None)
         glow_color = getattr(style, "glow_color", BLUE)
         color = color or glow_color
-        wires = wires if wires is not None else list(self.circuit._wires.keys())
-
-        anims = []
-        for wire_idx in wires:
-            wire = self.circuit._wires.get(wire_idx)
-            if wire is None:
-                continue
+        if wires is None:
+            rows = list(self._wire_rows.values())
+        else:
+            rows = [self._wire_rows[i] for i in wires if i in self._wire_rows]
 
-            y = wire.y
-            start = np.array([self.circuit.x_start, y, 0])
-            end = np.array([self.circuit.x_end, y, 0])
+        packets = []
+        for row in rows:
+            start = self._starts[row]
+            end = self._ends[row]
 
             outer = Circle(radius=0.2)
             outer.set_fill(color, opacity=0.3)
@@ -116,22 +198,11 @@ class CircuitEvaluationAnimation:
 
             packet = VGroup(outer, inner)
             packet.move_to(start)
+            packets.append((packet, start, end))
 
-            fade_time = 0.15 * run_time
-            move_time = 0.70 * run_time
-
-            seq = Succession(
-                FadeIn(packet, run_time=fade_time),
-                MoveAlongPath(
-                    packet, Line(start, end), run_time=move_time, rate_func=linear
-                ),
-                FadeOut(packet, run_time=fade_time),
-            )
-            anims.append(seq)
-
-        if not anims:
+        if not packets:
             return AnimationGroup()
-        return LaggedStart(*anims, lag_ratio=lag_ratio)
+        return _ShotBatch(packets, run_time=run_time, lag_ratio=lag_ratio)
 
     def create_glow_animation(
             self,
@@ -152,26 +223,25 @@ class CircuitEvaluationAnimation:
         Returns:
             Animation object.
         """
-        style = getattr(self.circuit, "style", None)
-        glow_color = getattr(style, "glow_color", BLUE)
-        color = color or glow_color
-        wires = wires if wires is not None else list(self.circuit._wires.keys())
-
-        anims = []
-        for wire_idx in wires:
-            wire = self.circuit._wires.get(wire_idx)
-            if wire is None:
-                continue
-
-            y = wire.y
-            start = np.array([self.circuit.x_start, y, 0])
-            end = np.array([self.circuit.x_end, y, 0])
-
-            glow_line = Line(start, end)
-            glow_line.set_stroke(color, width=8, opacity=0.7)
-
-            anims.append(ShowPassingFlash(glow_line, run_time=run_time, time_width=0.3))
+        if wires is None:
+            glow_lines = list(self._glow_lines.values())
+        else:
+            glow_lines = [self._glow_lines[i] for i in wires if i in self._glow_lines]
 
-        if not anims:
+        glow_group = VGroup(*glow_lines)
+        if not glow_group.submobjects:
             return AnimationGroup()
-        return LaggedStart(*anims, lag_ratio=lag_ratio)
+        glow_group = glow_group.copy()
+        if color is not None:
+            glow_group.set_stroke(color)
+
+        if lag_ratio == 0:
+            # All wires flash together, so a single animation drives every line
+            return ShowPassingFlash(glow_group, run_time=run_time, time_width=0.3)
+        return LaggedStart(
+            *(
+                ShowPassingFlash(glow_line, run_time=run_time, time_width=0.3)
+                for glow_line in glow_group.submobjects
+            ),
+            lag_ratio=lag_ratio,
+        )
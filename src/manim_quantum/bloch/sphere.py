@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import cmath
+import math
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import numpy as np
 from manim import (
-    DEGREES,
     ORIGIN,
     PI,
     Arrow3D,
@@ -14,16 +16,97 @@ from manim import (
     Line3D,
     MathTex,
     Surface,
-    ThreeDScene,
     VGroup,
+    VMobject,
 )
 
-from manim_quantum.styles import QuantumStyle
+from manim_quantum._tex import cached_math_tex
+from manim_quantum.styles import QuantumStyle, StylePresets
 
 if TYPE_CHECKING:
     from manim import Scene
 
 
+def _sphere_points(radius: float, uv: np.ndarray) -> np.ndarray:
+    """Map an (N, 3) array of (u, v, _) samples onto a sphere of the given radius."""
+    u = uv[:, 0]
+    v = uv[:, 1]
+    sin_v = np.sin(v)
+    return np.column_stack([
+        radius * sin_v * np.cos(u),
+        radius * sin_v * np.sin(u),
+        radius * np.cos(v),
+    ])
+
+
+def _has_vmobject_function_internals() -> bool:
+    """
+    Check for the VMobject internals _SphereSurface.apply_function mirrors.
+
+    They are present in Manim Community 0.18/0.19; the first two are set
+    per instance in VMobject.__init__, so a bare VMobject is inspected.
+    """
+    vmobject = VMobject()
+    return all(
+        hasattr(vmobject, name)
+        for name in (
+            "pre_function_handle_to_anchor_scale_factor",
+            "scale_handle_to_anchor_distances",
+            "make_smooth_after_applying_functions",
+        )
+    )
+
+
+# Whether the initial uv mapping of _SphereSurface can be vectorized; without
+# the VMobject internals it falls back to the per-point path
+_VECTORIZED_UV_MAPPING = _has_vmobject_function_internals()
+
+
+class _SphereSurface(Surface):
+    """
+    Sphere surface whose uv-space faces are mapped in one vectorized pass.
+
+    Surface maps every sample point through a Python callback. Here the
+    initial mapping concatenates the points of all faces, evaluates the
+    sphere parametrization with NumPy ufuncs once and writes the result
+    back. Later calls to apply_function behave as usual, as does the
+    initial one on Manim versions whose VMobject internals differ.
+
+    Args:
+        radius: Sphere radius.
+        **kwargs: Additional arguments for Surface.
+    """
+
+    def __init__(self, radius: float, **kwargs) -> None:
+        self._radius = radius
+        self._in_uv_space = True
+        super().__init__(
+            lambda u, v: _sphere_points(radius, np.array([[u, v, 0.0]]))[0],
+            **kwargs,
+        )
+
+    def apply_function(self, function, **kwargs):
+        """Apply a function to all points, vectorizing the initial uv mapping."""
+        in_uv_space, self._in_uv_space = self._in_uv_space, False
+        if not in_uv_space or not _VECTORIZED_UV_MAPPING:
+            return super().apply_function(function, **kwargs)
+
+        # Same handle treatment as VMobject.apply_function
+        factor = self.pre_function_handle_to_anchor_scale_factor
+        self.scale_handle_to_anchor_distances(factor)
+
+        faces = self.family_members_with_points()
+        points = _sphere_points(self._radius, np.concatenate([face.points for face in faces]))
+        offsets = np.cumsum([len(face.points) for face in faces])[:-1]
+        for face, face_points in zip(faces, np.split(points, offsets)):
+            face.points = face_points
+
+        self.scale_handle_to_anchor_distances(1.0 / factor)
+        if self.make_smooth_after_applying_functions:
+            self.make_smooth()
+        return self
+
+
 class BlochSphere(VGroup):
     """
     3D Bloch sphere visualization for single-qubit states.
@@ -39,6 +122,7 @@ class BlochSphere(VGroup):
         show_state_vector: Whether to show the state arrow.
         initial_state: Initial state as (theta, phi) in radians.
         style: Visual style configuration.
+        sphere_resolution: Number of (u, v) surface patches of the sphere.
 
     Note:
         This component requires a ThreeDScene to render properly.
@@ -54,6 +138,11 @@ class BlochSphere(VGroup):
         ...         self.add(bloch)
     """
 
+    # Fully built spheres copied by the state factories, keyed by their options,
+    # least recently used first
+    _prototypes: OrderedDict[tuple, BlochSphere] = OrderedDict()
+    _prototypes_size = 8
+
     def __init__(
             self,
             radius: float = 2.0,
@@ -63,6 +152,7 @@ class BlochSphere(VGroup):
             initial_state: tuple[float, float] | None = None,
             style: QuantumStyle | None = None,
             arrow_thickness: float = 0.02,
+            sphere_resolution: tuple[int, int] = (16, 8),
     ) -> None:
         super().__init__()
 
@@ -70,14 +160,17 @@ class BlochSphere(VGroup):
         self.show_axes = show_axes
         self.show_labels = show_labels
         self.show_state_vector = show_state_vector
-        self.style = style or QuantumStyle()
+        self.style = style or StylePresets.default()
         self.arrow_thickness = arrow_thickness
+        self.sphere_resolution = sphere_resolution
 
         # Current state in spherical coordinates (theta, phi)
         # theta: angle from +z axis (0 = |0⟩, pi = |1⟩)
         # phi: angle in xy-plane from +x axis
         self._theta = 0.0
         self._phi = 0.0
+        # Amplitudes of the current state, computed on demand
+        self._amplitudes: tuple[complex, complex] | None = None
 
         # Store labels separately for camera-facing behavior
         self._label_mobjects: list[MathTex] = []
@@ -110,18 +203,17 @@ class BlochSphere(VGroup):
 
     def _create_sphere(self) -> Surface:
         """Create the sphere surface."""
-        sphere = Surface(
-            lambda u, v: np.array([
-                self.radius * np.sin(v) * np.cos(u),
-                self.radius * np.sin(v) * np.sin(u),
-                self.radius * np.cos(v),
-            ]),
+        sphere = _SphereSurface(
+            self.radius,
             u_range=(0, 2 * PI),
             v_range=(0, PI),
-            resolution=(32, 16),
+            resolution=self.sphere_resolution,
         )
         sphere.set_fill(self.style.sphere_color, opacity=self.style.sphere_opacity)
-        sphere.set_stroke(self.style.sphere_color, width=0.5, opacity=0.3)
+        # A zero width skips the wireframe stroke pass entirely
+        sphere.set_stroke(
+            self.style.sphere_color, width=self.style.sphere_stroke_width, opacity=0.3
+        )
         return sphere
 
     def _create_axes(self) -> VGroup:
@@ -161,23 +253,23 @@ class BlochSphere(VGroup):
         r = self.radius * 1.5
 
         # Basis state labels
-        label_0 = MathTex("|0\\rangle", color=self.style.ket_color)
+        label_0 = cached_math_tex("|0\\rangle", color=self.style.ket_color)
         label_0.move_to(np.array([0, 0, r]))
         labels.add(label_0)
         self._label_mobjects.append(label_0)
 
-        label_1 = MathTex("|1\\rangle", color=self.style.ket_color)
+        label_1 = cached_math_tex("|1\\rangle", color=self.style.ket_color)
         label_1.move_to(np.array([0, 0, -r]))
         labels.add(label_1)
         self._label_mobjects.append(label_1)
 
         # Axis labels
-        x_label = MathTex("X", color=self.style.axis_color)
+        x_label = cached_math_tex("X", color=self.style.axis_color)
         x_label.move_to(np.array([r, 0, 0]))
         labels.add(x_label)
         self._label_mobjects.append(x_label)
 
-        y_label = MathTex("Y", color=self.style.axis_color)
+        y_label = cached_math_tex("Y", color=self.style.axis_color)
         y_label.move_to(np.array([0, r, 0]))
         labels.add(y_label)
         self._label_mobjects.append(y_label)
@@ -208,6 +300,8 @@ class BlochSphere(VGroup):
     def _create_state_arrow(self) -> Arrow3D:
         """Create the state vector arrow."""
         point = self._get_cartesian()
+        # Unit direction the arrow currently points along
+        self._arrow_direction = self._get_direction()
         arrow = Arrow3D(
             start=ORIGIN,
             end=point,
@@ -226,12 +320,18 @@ class BlochSphere(VGroup):
         )
         return dot
 
+    def _get_direction(self) -> tuple[float, float, float]:
+        """Get the unit vector of the current state."""
+        sin_theta = math.sin(self._theta)
+        return (
+            sin_theta * math.cos(self._phi),
+            sin_theta * math.sin(self._phi),
+            math.cos(self._theta),
+        )
+
     def _get_cartesian(self) -> np.ndarray:
         """Get cartesian coordinates of current state."""
-        x = self.radius * np.sin(self._theta) * np.cos(self._phi)
-        y = self.radius * np.sin(self._theta) * np.sin(self._phi)
-        z = self.radius * np.cos(self._theta)
-        return np.array([x, y, z])
+        return self.radius * np.array(self._get_direction())
 
     def set_state(self, theta: float, phi: float) -> None:
         """
@@ -243,12 +343,48 @@ class BlochSphere(VGroup):
         """
         self._theta = float(theta)
         self._phi = float(phi)
+        self._amplitudes = None
 
         if self.show_state_vector:
-            point = self._get_cartesian()
+            self._update_arrow_direction(*self._get_direction())
+
+    def _update_arrow_direction(self, x: float, y: float, z: float) -> None:
+        """
+        Point the state arrow along a unit direction without rebuilding it.
+
+        The existing arrow is rotated about the origin from its current
+        direction onto the new one. This also works for opposite directions
+        (e.g. from |0⟩ to |1⟩), where the rotation axis is not unique.
 
-            # Update arrow in place
-            self.state_arrow.put_start_and_end_on(ORIGIN, point)
+        Each call applies one more rotation to the same points, so rounding
+        errors accumulate: about 1e-16 of the radius per call, growing with
+        the square root of the number of calls (around 1e-13 after a
+        million frames), far below anything visible. Called by set_state(),
+        which keeps the stored angles and amplitudes in sync.
+
+        Args:
+            x: X component of the unit direction.
+            y: Y component of the unit direction.
+            z: Z component of the unit direction.
+        """
+        dx, dy, dz = self._arrow_direction
+        self._arrow_direction = (x, y, z)
+
+        # Rotation axis and angle from the cross and dot products
+        ax, ay, az = dy * z - dz * y, dz * x - dx * z, dx * y - dy * x
+        sin_angle = math.sqrt(ax * ax + ay * ay + az * az)
+        cos_angle = dx * x + dy * y + dz * z
+        if sin_angle < 1e-9:
+            if cos_angle > 0:
+                return
+            # Opposite directions: rotate about any axis perpendicular to the arrow
+            ax, ay, az = (0.0, dz, -dy) if abs(dx) < 0.9 else (-dz, 0.0, dx)
+
+        self.state_arrow.rotate(
+            math.atan2(sin_angle, cos_angle),
+            axis=np.array([ax, ay, az]),
+            about_point=ORIGIN,
+        )
 
     def get_theta(self) -> float:
         """
@@ -276,30 +412,62 @@ class BlochSphere(VGroup):
             alpha: Amplitude for |0⟩.
             beta: Amplitude for |1⟩.
         """
-        # Normalize
-        norm = np.sqrt(abs(alpha) ** 2 + abs(beta) ** 2)
-        if norm < 1e-10:
+        alpha = complex(alpha)
+        beta = complex(beta)
+
+        # Squared norm from the components, without abs() or a second division
+        norm_sq = alpha.real ** 2 + alpha.imag ** 2 + beta.real ** 2 + beta.imag ** 2
+        if norm_sq < 1e-20:
             self.set_state(0, 0)
             return
-
-        alpha = alpha / norm
-        beta = beta / norm
+        inv_norm = 1.0 / math.sqrt(norm_sq)
 
         # Convert to Bloch angles
         # |ψ⟩ = cos(θ/2)|0⟩ + e^(iφ)sin(θ/2)|1⟩
-        theta = 2 * np.arccos(min(1.0, abs(alpha)))
+        theta = 2 * math.acos(min(1.0, abs(alpha) * inv_norm))
 
-        if abs(beta) < 1e-10:
-            phi = 0.0
-        else:
-            # Extract relative phase
-            if abs(alpha) < 1e-10:
-                phi = float(np.angle(beta))
-            else:
-                phi = float(np.angle(beta) - np.angle(alpha))
+        # Relative phase arg(β) - arg(α), independent of the normalization;
+        # zero when either amplitude vanishes
+        phi = cmath.phase(beta * alpha.conjugate())
 
         self.set_state(theta, phi)
 
+    @staticmethod
+    def amplitudes_to_angles(alpha, beta) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convert qubit amplitudes to Bloch angles element-wise.
+
+        This is the vectorized counterpart of set_state_from_amplitudes(),
+        useful for converting a whole state trajectory at once before
+        animating it.
+
+        Args:
+            alpha: Amplitude(s) for |0⟩.
+            beta: Amplitude(s) for |1⟩.
+
+        Returns:
+            Tuple (theta, phi) of arrays with the broadcast shape of the inputs.
+
+        Example:
+            >>> thetas, phis = BlochSphere.amplitudes_to_angles(alphas, betas)
+            >>> bloch.set_state(thetas[0], phis[0])
+        """
+        alpha = np.asarray(alpha, dtype=complex)
+        beta = np.asarray(beta, dtype=complex)
+
+        # Normalize |α| only, treating (near) zero vectors as |0⟩
+        norm_sq = alpha.real ** 2 + alpha.imag ** 2 + beta.real ** 2 + beta.imag ** 2
+        valid = norm_sq >= 1e-20
+        inv_norm = 1.0 / np.sqrt(np.where(valid, norm_sq, 1.0))
+
+        theta = np.where(valid, 2 * np.arccos(np.minimum(1.0, np.abs(alpha) * inv_norm)), 0.0)
+
+        # Relative phase arg(β) - arg(α), independent of the normalization;
+        # zero when either amplitude vanishes
+        phi = np.angle(beta * np.conj(alpha))
+
+        return theta, phi
+
     def get_state_amplitudes(self) -> tuple[complex, complex]:
         """
         Get the qubit amplitudes for the current state.
@@ -307,9 +475,51 @@ class BlochSphere(VGroup):
         Returns:
             Tuple (alpha, beta) where |ψ⟩ = α|0⟩ + β|1⟩.
         """
-        alpha = np.cos(self._theta / 2)
-        beta = np.exp(1j * self._phi) * np.sin(self._theta / 2)
-        return complex(alpha), complex(beta)
+        if self._amplitudes is None:
+            half_theta = self._theta / 2
+            self._amplitudes = (
+                complex(math.cos(half_theta)),
+                cmath.rect(math.sin(half_theta), self._phi),
+            )
+        return self._amplitudes
+
+    @classmethod
+    def _from_prototype(cls, theta: float, phi: float, **kwargs) -> BlochSphere:
+        """
+        Create a sphere in the given state by copying a cached prototype.
+
+        Building a sphere samples the surface and renders the labels, so the
+        first sphere for each set of options is kept and later ones are
+        copied from it.
+
+        Args:
+            theta: Polar angle of the state.
+            phi: Azimuthal angle of the state.
+            **kwargs: Additional arguments for BlochSphere.
+
+        Returns:
+            A new BlochSphere in the given state.
+
+        Raises:
+            TypeError: If initial_state is passed, since the factory sets the state.
+        """
+        if "initial_state" in kwargs:
+            raise TypeError(
+                f"{cls.__name__} state factories set the state; initial_state is not accepted"
+            )
+
+        key = (cls, tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+        prototype = cls._prototypes.get(key)
+        if prototype is None:
+            prototype = cls._prototypes[key] = cls(**kwargs)
+            if len(cls._prototypes) > cls._prototypes_size:
+                cls._prototypes.popitem(last=False)
+        else:
+            cls._prototypes.move_to_end(key)
+
+        sphere = prototype.copy()
+        sphere.set_state(theta, phi)
+        return sphere
 
     @classmethod
     def basis_state(
@@ -329,24 +539,24 @@ class BlochSphere(VGroup):
         """
         state = str(state)
         theta = 0 if state == "0" else PI
-        return cls(initial_state=(theta, 0), **kwargs)
+        return cls._from_prototype(theta, 0, **kwargs)
 
     @classmethod
     def plus_state(cls, **kwargs) -> BlochSphere:
         """Create a Bloch sphere showing |+⟩ state (on +X axis)."""
-        return cls(initial_state=(PI / 2, 0), **kwargs)
+        return cls._from_prototype(PI / 2, 0, **kwargs)
 
     @classmethod
     def minus_state(cls, **kwargs) -> BlochSphere:
         """Create a Bloch sphere showing |-⟩ state (on -X axis)."""
-        return cls(initial_state=(PI / 2, PI), **kwargs)
+        return cls._from_prototype(PI / 2, PI, **kwargs)
 
     @classmethod
     def plus_i_state(cls, **kwargs) -> BlochSphere:
         """Create a Bloch sphere showing |+i⟩ state (on +Y axis)."""
-        return cls(initial_state=(PI / 2, PI / 2), **kwargs)
+        return cls._from_prototype(PI / 2, PI / 2, **kwargs)
 
     @classmethod
     def minus_i_state(cls, **kwargs) -> BlochSphere:
         """Create a Bloch sphere showing |-i⟩ state (on -Y axis)."""
-        return cls(initial_state=(PI / 2, 3 * PI / 2), **kwargs)
+        return cls._from_prototype(PI / 2, 3 * PI / 2, **kwargs)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Sequence
 
 import numpy as np
@@ -11,7 +12,7 @@ from manim import (
 
 from manim_quantum.circuits.gate import QuantumGate
 from manim_quantum.circuits.wire import QuantumWire
-from manim_quantum.styles import QuantumStyle
+from manim_quantum.styles import QuantumStyle, StylePresets
 
 if TYPE_CHECKING:
     pass
@@ -43,6 +44,10 @@ class QuantumCircuit(VGroup):
         >>> circuit.add_gate("Measure", [0, 1])
     """
 
+    # Recently built circuits of from_operations(), least recently used first
+    _operations_cache: OrderedDict[tuple, QuantumCircuit] = OrderedDict()
+    _operations_cache_size = 128
+
     def __init__(
             self,
             num_qubits: int = 2,
@@ -60,14 +65,19 @@ class QuantumCircuit(VGroup):
         self.x_start = x_start
         self.x_end = x_end
         self.wire_spacing = wire_spacing
-        self.style = style or QuantumStyle()
+        self.style = style or StylePresets.default()
         self.compress = compress
         self.center = center
 
         self._gates: list[QuantumGate] = []
         self._wires: dict[int, QuantumWire] = {}
-        self._gate_x_positions: list[float] = []
+        # Gate x-positions, stored in a geometrically grown buffer
+        self._gate_x_buffer = np.empty(16, dtype=np.float64)
         self._gate_visuals: list[VGroup] = []
+        self._num_added_visuals = 0
+        self._parameterized_gates: dict[str, list[QuantumGate]] = {}
+        # (wire index, mask index) of every wire mask of each gate
+        self._gate_masks: dict[QuantumGate, list[tuple[int, int]]] = {}
         self._next_gate_x = x_start + 1.5
         self._wire_next_free_layer: dict[int, int] = {i: 0 for i in range(num_qubits)}
         self._needs_rebuild = False
@@ -76,15 +86,29 @@ class QuantumCircuit(VGroup):
 
     def _build_wires(self, labels: list[str] | None) -> None:
         """Create the quantum wires."""
-        for i in range(self.num_qubits):
-            y = -i * self.wire_spacing
-            label = labels[i] if labels and i < len(labels) else None
-            wire = QuantumWire(
-                index=i, x_start=self.x_start, x_end=self.x_end,
-                y=y, label=label, style=self.style,
-            )
-            self._wires[i] = wire
-            self.add(wire)
+        wires = QuantumWire.build_batch(
+            self.num_qubits, self.x_start, self.x_end, self.wire_spacing,
+            labels=labels, style=self.style,
+        )
+        self._wires = {wire.index: wire for wire in wires}
+        self.add(*wires)
+
+        # Wires never move after construction, so their positions are cached
+        self._wire_positions = {idx: wire.y for idx, wire in self._wires.items()}
+
+        # Left and right endpoints of every wire, shape (num_qubits, 2, 3)
+        self._wire_endpoints = np.zeros((self.num_qubits, 2, 3))
+        self._wire_endpoints[:, 0, 0] = self.x_start
+        self._wire_endpoints[:, 1, 0] = self.x_end
+        self._wire_endpoints[:, :, 1] = np.fromiter(
+            self._wire_positions.values(), dtype=float, count=self.num_qubits
+        )[:, None]
+        self._wire_endpoints.flags.writeable = False
+
+    @property
+    def _gate_x_positions(self) -> np.ndarray:
+        """X-positions of all gates, in insertion order."""
+        return self._gate_x_buffer[:len(self._gates)]
 
     def _ensure_built(self) -> None:
         """Ensure the circuit is built before it's used."""
@@ -94,7 +118,7 @@ class QuantumCircuit(VGroup):
 
     def _get_wire_positions(self) -> dict[int, float]:
         """Get mapping from wire index to y-coordinate."""
-        return {idx: wire.y for idx, wire in self._wires.items()}
+        return self._wire_positions
 
     def add_gate(
             self,
@@ -102,6 +126,7 @@ class QuantumCircuit(VGroup):
             target_wires: list[int],
             params: list[float | str] | None = None,
             x: float | None = None,
+            param_name: str | None = None,
     ) -> QuantumGate:
         """
         Add a gate to the circuit.
@@ -111,6 +136,8 @@ class QuantumCircuit(VGroup):
             target_wires: Wire indices the gate acts on.
             params: Optional parameters (e.g., rotation angles).
             x: Optional x-position; auto-calculated if not provided.
+            param_name: Optional name of the symbolic parameter bound to the
+                first parameter, so it can be changed later via set_parameter().
 
         Returns:
             The created QuantumGate object.
@@ -120,6 +147,7 @@ class QuantumCircuit(VGroup):
             target_wires=target_wires,
             params=params,
             style=self.style,
+            param_name=param_name,
         )
 
         if x is None:
@@ -135,49 +163,69 @@ class QuantumCircuit(VGroup):
                 x = self._next_gate_x
                 self._next_gate_x += self.style.gate_spacing
 
-        self._gate_x_positions.append(x)
+        num_gates = len(self._gates)
+        if num_gates == len(self._gate_x_buffer):
+            self._gate_x_buffer = np.concatenate(
+                [self._gate_x_buffer, np.empty_like(self._gate_x_buffer)]
+            )
+        self._gate_x_buffer[num_gates] = x
         self._gates.append(gate)
+        if param_name is not None:
+            self._parameterized_gates.setdefault(param_name, []).append(gate)
 
-        wire_positions = self._get_wire_positions()
-        gate_visual = gate.render(wire_positions, x)
+        gate_visual = gate.render(self._wire_positions, x)
+        # Visuals are added to the group in one batch by build()
         self._gate_visuals.append(gate_visual)
-        self.add(gate_visual)
 
         half_width = gate.get_mask_width() / 2
-        for wire_idx in target_wires:
-            if wire_idx in self._wires:
-                self._wires[wire_idx].mask_region(x, half_width)
+        self._gate_masks[gate] = [
+            (wire_idx, self._wires[wire_idx].mask_region(x, half_width))
+            for wire_idx in target_wires
+            if wire_idx in self._wires
+        ]
 
         self._needs_rebuild = True
         return gate
 
     def add_gates(
-            self, gates: Sequence[tuple[str, list[int]] | tuple[str, list[int], list[float | str]]]
+            self,
+            gates: Sequence[
+                tuple[str, list[int]]
+                | tuple[str, list[int], list[float | str] | None]
+                | tuple[str, list[int], list[float | str] | None, str | None]
+            ],
     ) -> list[QuantumGate]:
         """
         Add multiple gates at once.
 
         Args:
-            gates: List of gate specifications as (name, wires) or (name, wires, params).
+            gates: List of gate specifications as (name, wires), (name, wires, params)
+                or (name, wires, params, param_name).
 
         Returns:
             List of created QuantumGate objects.
         """
-        created = []
-        for gate_spec in gates:
-            if len(gate_spec) == 2:
-                name, wires = gate_spec
-                params = None
-            else:
-                name, wires, params = gate_spec
-            created.append(self.add_gate(name, wires, params))
-        return created
+        specs = [
+            (
+                gate_spec[0],
+                gate_spec[1],
+                gate_spec[2] if len(gate_spec) > 2 else None,
+                gate_spec[3] if len(gate_spec) > 3 else None,
+            )
+            for gate_spec in gates
+        ]
+
+        return [
+            self.add_gate(name, wires, params, param_name=param_name)
+            for name, wires, params, param_name in specs
+        ]
 
     def build(self) -> QuantumCircuit:
         """
         Finalize the circuit after all gates are added.
 
-        This rebuilds wire segments to properly show breaks at gate positions.
+        This adds the pending gate visuals to the circuit in one batch and
+        rebuilds wire segments to properly show breaks at gate positions.
         If center=True, gates will be centered horizontally within the circuit bounds.
 
         Note: This is called automatically when the circuit is rendered, so manual
@@ -186,7 +234,12 @@ class QuantumCircuit(VGroup):
         Returns:
             Self for method chaining.
         """
-        if self.center and self._gate_x_positions:
+        pending = self._gate_visuals[self._num_added_visuals:]
+        if pending:
+            self.add(*pending)
+            self._num_added_visuals = len(self._gate_visuals)
+
+        if self.center and self._gates:
             self._center_gates()
 
         for wire in self._wires.values():
@@ -197,12 +250,13 @@ class QuantumCircuit(VGroup):
 
     def _center_gates(self) -> None:
         """Center all gates horizontally within the circuit bounds."""
-        if not self._gate_x_positions:
+        positions = self._gate_x_positions
+        if not len(positions):
             return
 
         # Calculate the bounding box of all gates
-        min_gate_x = min(self._gate_x_positions)
-        max_gate_x = max(self._gate_x_positions)
+        min_gate_x = positions.min()
+        max_gate_x = positions.max()
 
         # Calculate current gates center and target center
         gates_center = (min_gate_x + max_gate_x) / 2
@@ -215,14 +269,44 @@ class QuantumCircuit(VGroup):
             return
 
         # Shift all gate positions and visuals
-        for i, gate_visual in enumerate(self._gate_visuals):
-            self._gate_x_positions[i] += offset
-            gate_visual.shift(np.array([offset, 0, 0]))
+        positions += offset
+        shift = np.array([offset, 0, 0])
+        for gate_visual in self._gate_visuals:
+            gate_visual.shift(shift)
 
         # Update wire mask regions
         for wire in self._wires.values():
             wire.shift_masks(offset)
 
+    def set_parameter(self, name: str, value: float | str) -> None:
+        """
+        Update a named gate parameter without rebuilding the circuit.
+
+        Only the labels of the gates bound to the parameter are re-rendered
+        (with their boxes and wire gaps resized if the label width changes),
+        so this is suitable for updaters driven by a ValueTracker.
+
+        Args:
+            name: Parameter name given to add_gate() (e.g., "theta").
+            value: New parameter value.
+
+        Example:
+            >>> circuit.add_gate("RY", [0], params=[0.5], param_name="theta")
+            >>> circuit.set_parameter("theta", np.pi / 2)
+        """
+        resized_wires = set()
+        for gate in self._parameterized_gates.get(name, []):
+            gate.params = [value, *gate.params[1:]]
+            mask_width = gate.get_mask_width()
+            gate.update_label()
+            if gate.get_mask_width() != mask_width:
+                for wire_idx, mask_idx in self._gate_masks[gate]:
+                    self._wires[wire_idx].resize_mask(mask_idx, gate.get_mask_width() / 2)
+                    resized_wires.add(wire_idx)
+
+        for wire_idx in resized_wires:
+            self._wires[wire_idx].rebuild_segments()
+
     def get_wire(self, index: int) -> QuantumWire | None:
         """Get a wire by index."""
         return self._wires.get(index)
@@ -236,13 +320,12 @@ class QuantumCircuit(VGroup):
             side: "left" or "right".
 
         Returns:
-            3D coordinate array.
+            New 3D coordinate array.
         """
-        wire = self._wires.get(wire_index)
-        if wire is None:
+        if wire_index not in self._wires:
             return np.array([0, 0, 0])
-        x = self.x_start if side == "left" else self.x_end
-        return np.array([x, wire.y, 0])
+        # Internal code reads _wire_endpoints directly; callers get their own copy
+        return self._wire_endpoints[wire_index, 0 if side == "left" else 1].copy()
 
     def highlight_wires(self, wires: list[int], color=None) -> None:
         """Highlight specified wires."""
@@ -259,56 +342,67 @@ class QuantumCircuit(VGroup):
             if wire:
                 wire.reset_highlight()
 
-    # Override methods to ensure circuit is built before use
+    # Override methods to ensure circuit is built before use. The flag is checked
+    # inline since the renderer calls some of these for every frame.
     def get_center(self):
         """Get the center of the circuit, ensuring it's built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().get_center()
 
     def get_top(self):
         """Get the top of the circuit, ensuring it's built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().get_top()
 
     def get_bottom(self):
         """Get the bottom of the circuit, ensuring it's built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().get_bottom()
 
     def get_left(self):
         """Get the left of the circuit, ensuring it's built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().get_left()
 
     def get_right(self):
         """Get the right of the circuit, ensuring it's built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().get_right()
 
     def get_family(self, *args, **kwargs):
         """Get the mobject family, ensuring the circuit is built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().get_family(*args, **kwargs)
 
     def family_members_with_points(self):
         """Get family members with points, ensuring the circuit is built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().family_members_with_points()
 
     def get_all_points(self) -> np.ndarray:
         """Get all points, ensuring the circuit is built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         result = super().get_all_points()
         return np.asarray(result)
 
     def get_critical_point(self, direction):
         """Get a critical point, ensuring the circuit is built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().get_critical_point(direction)
 
     def generate_target(self, use_deepcopy: bool = True):
         """Generate a target for animations, ensuring the circuit is built first."""
-        self._ensure_built()
+        if self._needs_rebuild:
+            self.build()
         return super().generate_target(use_deepcopy=use_deepcopy)
 
     @classmethod
@@ -321,6 +415,10 @@ class QuantumCircuit(VGroup):
         """
         Create a circuit from a list of operations.
 
+        The most recently built circuits are cached by their operations and
+        options, so building the same circuit again returns a copy of the
+        cached one instead of rendering every gate anew.
+
         Args:
             operations: List of (gate_name, wires, params) tuples.
             num_qubits: Number of qubits (auto-detected if None).
@@ -330,11 +428,108 @@ class QuantumCircuit(VGroup):
             Configured QuantumCircuit instance.
         """
         if num_qubits is None:
-            all_wires = [w for _, wires, _ in operations for w in wires]
-            num_qubits = max(all_wires) + 1 if all_wires else 1
+            num_qubits = max((max(wires) for _, wires, _ in operations if wires), default=0) + 1
+
+        key = (
+            cls,
+            tuple(
+                (name, tuple(wires), tuple(params) if params else None)
+                for name, wires, params in operations
+            ),
+            num_qubits,
+            tuple(sorted((name, repr(value)) for name, value in kwargs.items())),
+        )
+        cached = cls._operations_cache.get(key)
+        if cached is not None:
+            cls._operations_cache.move_to_end(key)
+            return cached.copy()
 
         circuit = cls(num_qubits=num_qubits, **kwargs)
-        for name, wires, params in operations:
-            circuit.add_gate(name, wires, params if params else None)
+        circuit.add_gates(
+            [(name, wires, params if params else None) for name, wires, params in operations]
+        )
+
+        cls._operations_cache[key] = circuit
+        if len(cls._operations_cache) > cls._operations_cache_size:
+            cls._operations_cache.popitem(last=False)
+        return circuit.copy()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all circuits cached by from_operations()."""
+        cls._operations_cache.clear()
+
+    @classmethod
+    def from_arrays(
+            cls,
+            gate_names: Sequence[str],
+            wire_offsets: Sequence[int] | np.ndarray,
+            wire_flat: Sequence[int] | np.ndarray,
+            params: Sequence[list[float | str] | None] | None = None,
+            num_qubits: int | None = None,
+            **kwargs,
+    ) -> QuantumCircuit:
+        """
+        Create a circuit from flat gate arrays.
+
+        This is an alternative to from_operations() for large generated
+        circuits. The target wires of all gates are stored back to back in
+        wire_flat, and gate i acts on wire_flat[wire_offsets[i]:wire_offsets[i + 1]].
+
+        Args:
+            gate_names: Gate name of each gate.
+            wire_offsets: Start offsets into wire_flat, with one extra final entry.
+            wire_flat: Concatenated target wires of all gates.
+            params: Optional parameters of each gate (None for no parameters).
+            num_qubits: Number of qubits (auto-detected if None).
+            **kwargs: Additional arguments for QuantumCircuit.
+
+        Returns:
+            Configured QuantumCircuit instance.
+
+        Raises:
+            ValueError: If wire_offsets does not hold one non-decreasing start
+                offset per gate plus a final end offset within wire_flat, or
+                params does not hold one entry per gate.
+
+        Example:
+            >>> circuit = QuantumCircuit.from_arrays(
+            ...     ["H", "CNOT"], wire_offsets=[0, 1, 3], wire_flat=[0, 0, 1]
+            ... )
+        """
+        wire_offsets = np.asarray(wire_offsets, dtype=np.intp)
+        wire_flat = np.asarray(wire_flat, dtype=np.intp)
+
+        if wire_offsets.shape != (len(gate_names) + 1,):
+            raise ValueError(
+                f"wire_offsets needs {len(gate_names) + 1} entries for {len(gate_names)} gates, "
+                f"got shape {wire_offsets.shape}"
+            )
+        if np.any(np.diff(wire_offsets) < 0):
+            raise ValueError("wire_offsets must be non-decreasing")
+        if wire_offsets[0] < 0 or wire_offsets[-1] > len(wire_flat):
+            raise ValueError(
+                f"wire_offsets must lie within wire_flat (0 to {len(wire_flat)}), "
+                f"got {wire_offsets[0]} to {wire_offsets[-1]}"
+            )
+        if params is not None and len(params) != len(gate_names):
+            raise ValueError(
+                f"params needs one entry per gate ({len(gate_names)}), got {len(params)}"
+            )
+
+        if num_qubits is None:
+            num_qubits = int(wire_flat.max()) + 1 if wire_flat.size else 1
+
+        circuit = cls(num_qubits=num_qubits, **kwargs)
+        bounds = wire_offsets.tolist()
+        wires = wire_flat.tolist()
+        circuit.add_gates([
+            (
+                name,
+                wires[bounds[i]:bounds[i + 1]],
+                (params[i] if params is not None else None) or None,
+            )
+            for i, name in enumerate(gate_names)
+        ])
 
         return circuit
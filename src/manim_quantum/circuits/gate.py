@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from functools import lru_cache
 
 import numpy as np
 from manim import (
@@ -12,15 +13,60 @@ from manim import (
     MathTex,
     Rectangle,
     VGroup,
+    VMobject,
 )
 
-if TYPE_CHECKING:
-    from manim_quantum.styles import QuantumStyle
+from manim_quantum._tex import cached_math_tex, place_scaled
+from manim_quantum.styles import QuantumStyle, StylePresets
 
 # Gate type categories
-SINGLE_QUBIT_GATES = {"H", "X", "Y", "Z", "S", "Sdg", "T", "Tdg", "RX", "RY", "RZ", "U", "I"}
-TWO_QUBIT_GATES = {"CNOT", "CX", "CZ", "CY", "SWAP", "ISWAP", "CRX", "CRY", "CRZ"}
-MEASUREMENT_GATES = {"Measure", "M"}
+SINGLE_QUBIT_GATES = frozenset({
+    "H", "X", "Y", "Z", "S", "Sdg", "T", "Tdg", "RX", "RY", "RZ", "U", "I",
+})
+TWO_QUBIT_GATES = frozenset({"CNOT", "CX", "CZ", "CY", "SWAP", "ISWAP", "CRX", "CRY", "CRZ"})
+MEASUREMENT_GATES = frozenset({"Measure", "M"})
+# Names kept as given instead of upper-cased
+_CASE_SENSITIVE_GATES = frozenset({"Measure", "Sdg", "Tdg"})
+# Gates whose first parameter is shown in the label
+_ROTATION_GATES = frozenset({"RX", "RY", "RZ"})
+_DAGGER_LABELS = {"Sdg": r"S^{\dagger}", "Tdg": r"T^{\dagger}"}
+
+# LaTeX labels for angles close to k * π/4, keyed by k
+_PI_FRACTIONS = {4: r"\pi", 2: r"\frac{\pi}{2}", 1: r"\frac{\pi}{4}"}
+
+# Unit half circle from π to 0 used for the measurement meter arc
+_ARC_ANGLES = np.linspace(np.pi, 0, 10)
+_ARC_UNIT = np.column_stack([np.cos(_ARC_ANGLES), np.sin(_ARC_ANGLES), np.zeros_like(_ARC_ANGLES)])
+
+
+@lru_cache(maxsize=1024)
+def _format_angle(angle: float) -> str:
+    """Format a rotation angle, using LaTeX for common fractions of π."""
+    k = round(angle / (math.pi / 4))
+    if k in _PI_FRACTIONS and abs(angle - k * math.pi / 4) < 0.01:
+        return _PI_FRACTIONS[k]
+    return f"{angle:.2f}"
+
+
+def _normalize_name(name: str) -> str:
+    """Upper-case a gate name, preserving case for gates like Measure and Sdg."""
+    return name if name in _CASE_SENSITIVE_GATES else name.upper()
+
+
+@lru_cache(maxsize=1024)
+def _label_parts(name: str, angle: float | str | None) -> tuple[str, ...]:
+    """
+    Split a gate label into the LaTeX fragments it is rendered from.
+
+    Numeric angles get their own fragment so the gate name and parentheses
+    keep the same shape whatever the angle; symbolic angles are rendered as
+    part of a single fragment.
+    """
+    if angle is None:
+        return (_DAGGER_LABELS.get(name, name),)
+    if isinstance(angle, str):
+        return (f"{name}({angle})",)
+    return (f"{name}(", _format_angle(angle), ")")
 
 
 class QuantumGate(VGroup):
@@ -35,40 +81,75 @@ class QuantumGate(VGroup):
         target_wires: Wire indices the gate acts on.
         params: Optional parameters for parameterized gates.
         style: Visual style configuration.
+        param_name: Optional name of the symbolic parameter bound to the first
+            parameter, used to update the label in place (e.g., "theta").
 
     Example:
         >>> gate = QuantumGate("H", [0])
         >>> gate.render(wire_positions={0: 0}, x=0)
     """
 
+    # Renderer method for each known gate name; other gates use _render_generic
+    _RENDERERS: dict[str, str] = {
+        **dict.fromkeys(SINGLE_QUBIT_GATES, "_render_single_qubit"),
+        "CNOT": "_render_cnot",
+        "CX": "_render_cnot",
+        "CZ": "_render_controlled_gate",
+        "CY": "_render_controlled_gate",
+        **dict.fromkeys(("CRX", "CRY", "CRZ"), "_render_controlled_gate"),
+        "SWAP": "_render_swap",
+        **dict.fromkeys(MEASUREMENT_GATES, "_render_measurement"),
+    }
+    _TWO_WIRE_RENDERERS = frozenset({"_render_cnot", "_render_controlled_gate", "_render_swap"})
+    # Space between a single-qubit gate label and its box, on each side
+    _LABEL_PADDING = 0.2
+    # Size of the target box and label of a controlled gate relative to a
+    # single-qubit gate, and its label padding (the box only grows for
+    # labels that would not fit, such as CRX angles)
+    _CONTROLLED_SCALE = 0.8
+    _CONTROLLED_LABEL_PADDING = 0.05
+
     def __init__(
             self,
             name: str,
             target_wires: list[int],
             params: list[float | str] | None = None,
-            style: "QuantumStyle | None" = None,
+            style: QuantumStyle | None = None,
+            param_name: str | None = None,
     ) -> None:
         super().__init__()
 
-        # Preserve case for special gates like Measure and dagger gates
-        if name not in {"Measure", "Sdg", "Tdg"}:
-            self.name = name.upper()
-        else:
-            self.name = name
-        self.target_wires = target_wires
+        self.name = _normalize_name(name)
+        # Copy so later changes to the caller's list don't move the gate
+        self.target_wires = list(target_wires)
+        if (
+                self._RENDERERS.get(self.name) in self._TWO_WIRE_RENDERERS
+                and len(self.target_wires) < 2
+        ):
+            raise ValueError(
+                f"Gate {self.name} needs two target wires, got {self.target_wires}"
+            )
         self.params = params or []
+        self.param_name = param_name
 
-        # Import here to avoid circular imports
-        from manim_quantum.styles import QuantumStyle
-        self.style = style or QuantumStyle()
+        self.style = style or StylePresets.default()
 
         self._visual: VGroup | None = None
+        self._label: VGroup | MathTex | None = None
+        self._box: Rectangle | None = None
+        # Label scale and padding of the boxed label, see _box_size()
+        self._label_fit = (1.0, self._LABEL_PADDING)
+        self._render_key: tuple | None = None
         self._mask_width = 0.6
 
     def render(self, wire_positions: dict[int, float], x: float) -> VGroup:
         """
         Render the gate at the specified position.
 
+        Rendering again at the same x and wire heights returns the existing
+        visual; different arguments replace it. Call invalidate() to force
+        a fresh render, e.g. after changing the style.
+
         Args:
             wire_positions: Mapping of wire index to y-coordinate.
             x: x-coordinate for the gate.
@@ -76,23 +157,29 @@ class QuantumGate(VGroup):
         Returns:
             VGroup containing the gate visualization.
         """
-        if self.name in SINGLE_QUBIT_GATES:
-            self._visual = self._render_single_qubit(wire_positions, x)
-        elif self.name in {"CNOT", "CX"}:
-            self._visual = self._render_cnot(wire_positions, x)
-        elif self.name in {"CZ", "CY"}:
-            self._visual = self._render_controlled_gate(wire_positions, x)
-        elif self.name == "SWAP":
-            self._visual = self._render_swap(wire_positions, x)
-        elif self.name in MEASUREMENT_GATES:
-            self._visual = self._render_measurement(wire_positions, x)
-        else:
-            # Default: render as a generic gate box
-            self._visual = self._render_generic(wire_positions, x)
+        render_key = (x, tuple(wire_positions.get(w, 0) for w in self.target_wires))
+        if self._visual is not None:
+            if render_key == self._render_key:
+                return self._visual
+            self.remove(self._visual)
+
+        # Default: render as a generic gate box
+        renderer = getattr(self, self._RENDERERS.get(self.name, "_render_generic"))
+        self._visual = renderer(wire_positions, x)
+        self._render_key = render_key
 
         self.add(self._visual)
         return self._visual
 
+    def invalidate(self) -> None:
+        """Discard the rendered visual so the next render() rebuilds it."""
+        if self._visual is not None:
+            self.remove(self._visual)
+        self._visual = None
+        self._label = None
+        self._box = None
+        self._render_key = None
+
     def _render_single_qubit(
             self, wire_positions: dict[int, float], x: float
     ) -> VGroup:
@@ -100,21 +187,12 @@ class QuantumGate(VGroup):
         wire_idx = self.target_wires[0]
         y = wire_positions.get(wire_idx, 0)
 
-        group = VGroup()
-
         # Create gate label (may be hybrid for parameterized gates)
         label = self._create_gate_label()
-        label.scale(self.style.gate_font_scale)
-        label.move_to(np.array([x, y, 0]))
-
-        # Calculate box width based on label width with padding
-        label_width = label.width
-        label_height = label.height
-        padding = 0.2  # Padding on each side
-        box_width = max(self.style.gate_width, label_width + 2 * padding)
-        box_height = max(self.style.gate_height, label_height + 2 * padding)
+        place_scaled(label, self.style.gate_font_scale, [x, y, 0])
 
-        # Gate box
+        # Gate box, grown to fit the label
+        box_width, box_height = self._box_size(label)
         box = Rectangle(
             width=box_width,
             height=box_height,
@@ -123,41 +201,36 @@ class QuantumGate(VGroup):
             stroke_color=self.style.gate_stroke_color,
             stroke_width=self.style.gate_stroke_width,
         )
-        box.move_to(np.array([x, y, 0]))
-
-        group.add(box)
-        group.add(label)
+        box.move_to([x, y, 0])
 
+        self._label = label
+        self._box = box
+        self._label_fit = (1.0, self._LABEL_PADDING)
         self._mask_width = box_width
 
-        return group
+        return VGroup(box, label)
 
     def _render_cnot(self, wire_positions: dict[int, float], x: float) -> VGroup:
         """Render a CNOT (controlled-X) gate."""
-        control_wire = self.target_wires[0]
-        target_wire = self.target_wires[1]
+        control_wire, target_wire = self.target_wires[:2]
 
         control_y = wire_positions.get(control_wire, 0)
         target_y = wire_positions.get(target_wire, 0)
 
-        group = VGroup()
-
         # Vertical line connecting control and target
         conn_line = Line(
-            start=np.array([x, control_y, 0]),
-            end=np.array([x, target_y, 0]),
+            start=[x, control_y, 0],
+            end=[x, target_y, 0],
             color=self.style.gate_stroke_color,
             stroke_width=self.style.wire_stroke_width,
         )
-        group.add(conn_line)
 
         # Control dot
         control_dot = Dot(
-            point=np.array([x, control_y, 0]),
+            point=[x, control_y, 0],
             radius=self.style.control_dot_radius,
             color=self.style.control_dot_color,
         )
-        group.add(control_dot)
 
         # Target (⊕ symbol)
         target_circle = Circle(
@@ -165,130 +238,125 @@ class QuantumGate(VGroup):
             color=self.style.gate_stroke_color,
             stroke_width=self.style.gate_stroke_width,
         )
-        target_circle.move_to(np.array([x, target_y, 0]))
-        group.add(target_circle)
+        target_circle.move_to([x, target_y, 0])
 
-        # Cross lines inside target circle
-        cross_h = Line(
-            start=np.array([x - self.style.target_radius, target_y, 0]),
-            end=np.array([x + self.style.target_radius, target_y, 0]),
-            color=self.style.gate_stroke_color,
-            stroke_width=self.style.gate_stroke_width,
-        )
-        cross_v = Line(
-            start=np.array([x, target_y - self.style.target_radius, 0]),
-            end=np.array([x, target_y + self.style.target_radius, 0]),
-            color=self.style.gate_stroke_color,
-            stroke_width=self.style.gate_stroke_width,
+        # Cross inside target circle, both strokes in one mobject
+        r = self.style.target_radius
+        cross = self._cross(
+            [x - r, target_y, 0], [x + r, target_y, 0],
+            [x, target_y - r, 0], [x, target_y + r, 0],
         )
-        group.add(cross_h, cross_v)
 
         self._mask_width = self.style.target_radius * 2
 
-        return group
+        return VGroup(conn_line, control_dot, target_circle, cross)
 
     def _render_controlled_gate(
             self, wire_positions: dict[int, float], x: float
     ) -> VGroup:
         """Render a controlled gate (CZ, CY, etc.)."""
-        control_wire = self.target_wires[0]
-        target_wire = self.target_wires[1]
+        control_wire, target_wire = self.target_wires[:2]
 
         control_y = wire_positions.get(control_wire, 0)
         target_y = wire_positions.get(target_wire, 0)
 
-        group = VGroup()
-
         # Vertical line
         conn_line = Line(
-            start=np.array([x, control_y, 0]),
-            end=np.array([x, target_y, 0]),
+            start=[x, control_y, 0],
+            end=[x, target_y, 0],
             color=self.style.gate_stroke_color,
             stroke_width=self.style.wire_stroke_width,
         )
-        group.add(conn_line)
 
         # Control dot
         control_dot = Dot(
-            point=np.array([x, control_y, 0]),
+            point=[x, control_y, 0],
             radius=self.style.control_dot_radius,
             color=self.style.control_dot_color,
         )
-        group.add(control_dot)
 
-        # Target gate box
-        gate_label = self.name[1:]  # Remove "C" prefix
+        # Target gate label, e.g. "Z" for CZ or "RX(θ)" for CRX
+        scale, padding = self._CONTROLLED_SCALE, self._CONTROLLED_LABEL_PADDING
+        label = self._create_gate_label()
+        place_scaled(label, self.style.gate_font_scale * scale, [x, target_y, 0])
+
+        # Target gate box, grown to fit the label
+        box_width, box_height = self._box_size(label, scale, padding)
         box = Rectangle(
-            width=self.style.gate_width * 0.8,
-            height=self.style.gate_height * 0.8,
+            width=box_width,
+            height=box_height,
             fill_color=self.style.gate_fill_color,
             fill_opacity=self.style.gate_fill_opacity,
             stroke_color=self.style.gate_stroke_color,
             stroke_width=self.style.gate_stroke_width,
         )
-        box.move_to(np.array([x, target_y, 0]))
-        group.add(box)
+        box.move_to([x, target_y, 0])
 
-        # Always use MathTex for gate labels
-        label = MathTex(gate_label, color=self.style.gate_text_color)
+        self._label = label
+        self._box = box
+        self._label_fit = (scale, padding)
+        self._mask_width = max(self.style.gate_width, box_width)
 
-        label.scale(self.style.gate_font_scale * 0.8)
-        label.move_to(np.array([x, target_y, 0]))
-        group.add(label)
-
-        self._mask_width = self.style.gate_width
-
-        return group
+        return VGroup(conn_line, control_dot, box, label)
 
     def _render_swap(self, wire_positions: dict[int, float], x: float) -> VGroup:
         """Render a SWAP gate."""
-        wire1 = self.target_wires[0]
-        wire2 = self.target_wires[1]
+        wire1, wire2 = self.target_wires[:2]
 
         y1 = wire_positions.get(wire1, 0)
         y2 = wire_positions.get(wire2, 0)
 
-        group = VGroup()
-
         # Vertical line
         conn_line = Line(
-            start=np.array([x, y1, 0]),
-            end=np.array([x, y2, 0]),
+            start=[x, y1, 0],
+            end=[x, y2, 0],
             color=self.style.gate_stroke_color,
             stroke_width=self.style.wire_stroke_width,
         )
-        group.add(conn_line)
 
         # X symbols at each wire
-        for y in [y1, y2]:
-            size = 0.15
-            cross1 = Line(
-                start=np.array([x - size, y - size, 0]),
-                end=np.array([x + size, y + size, 0]),
-                color=self.style.gate_stroke_color,
-                stroke_width=self.style.gate_stroke_width,
-            )
-            cross2 = Line(
-                start=np.array([x - size, y + size, 0]),
-                end=np.array([x + size, y - size, 0]),
-                color=self.style.gate_stroke_color,
-                stroke_width=self.style.gate_stroke_width,
+        size = 0.15
+        crosses = [
+            self._cross(
+                [x - size, y - size, 0], [x + size, y + size, 0],
+                [x - size, y + size, 0], [x + size, y - size, 0],
             )
-            group.add(cross1, cross2)
+            for y in [y1, y2]
+        ]
 
         self._mask_width = 0.4
 
-        return group
+        return VGroup(conn_line, *crosses)
+
+    def _cross(self, start1, end1, start2, end2) -> VMobject:
+        """Build two crossing strokes as a single mobject with two subpaths."""
+        cross = VMobject(
+            color=self.style.gate_stroke_color,
+            stroke_width=self.style.gate_stroke_width,
+        )
+        cross.set_points_as_corners(np.array([start1, end1], dtype=float))
+        cross.start_new_path(np.array(start2, dtype=float))
+        cross.add_line_to(np.array(end2, dtype=float))
+        return cross
 
     def _render_measurement(
             self, wire_positions: dict[int, float], x: float
     ) -> VGroup:
         """Render a measurement gate."""
-        group = VGroup()
-
-        for wire_idx in self.target_wires:
-            y = wire_positions.get(wire_idx, 0)
-
+        parts: list[VMobject] = []
+
+        # Meter geometry for all measured wires at once, one row per wire
+        arc_radius = self.style.gate_height * 0.25
+        ys = np.array([wire_positions.get(w, 0) for w in self.target_wires], dtype=float)
+        arc_centers = np.column_stack([
+            np.full_like(ys, x), ys - arc_radius * 0.3, np.zeros_like(ys)
+        ])
+        arc_points = arc_centers[:, None, :] + arc_radius * _ARC_UNIT
+        needle_ends = np.column_stack([
+            np.full_like(ys, x + arc_radius * 0.7), ys + arc_radius * 0.5, np.zeros_like(ys)
+        ])
+
+        for y, arc_center, arc_pts, needle_end in zip(ys, arc_centers, arc_points, needle_ends):
             # Measurement box
             box = Rectangle(
                 width=self.style.gate_width,
@@ -298,48 +366,30 @@ class QuantumGate(VGroup):
                 stroke_color=self.style.gate_stroke_color,
                 stroke_width=self.style.gate_stroke_width,
             )
-            box.move_to(np.array([x, y, 0]))
-            group.add(box)
-
-            # Meter arc
-            arc_radius = self.style.gate_height * 0.25
-            arc_center = np.array([x, y - arc_radius * 0.3, 0])
-
-            # Simple arc representation using lines
-            arc_points = []
-            for angle in np.linspace(np.pi, 0, 10):
-                px = arc_center[0] + arc_radius * np.cos(angle)
-                py = arc_center[1] + arc_radius * np.sin(angle)
-                arc_points.append(np.array([px, py, 0]))
-
-            for i in range(len(arc_points) - 1):
-                seg = Line(
-                    start=arc_points[i],
-                    end=arc_points[i + 1],
-                    color=self.style.gate_text_color,
-                    stroke_width=1.5,
-                )
-                group.add(seg)
+            box.move_to([x, y, 0])
+
+            # Meter arc as a single polyline
+            arc = VMobject(color=self.style.gate_text_color, stroke_width=1.5)
+            arc.set_points_as_corners(arc_pts)
 
             # Meter needle
             needle = Line(
                 start=arc_center,
-                end=np.array([x + arc_radius * 0.7, y + arc_radius * 0.5, 0]),
+                end=needle_end,
                 color=self.style.gate_text_color,
                 stroke_width=1.5,
             )
-            group.add(needle)
+
+            parts.extend((box, arc, needle))
 
         self._mask_width = self.style.gate_width
 
-        return group
+        return VGroup(*parts)
 
     def _render_generic(
             self, wire_positions: dict[int, float], x: float
     ) -> VGroup:
         """Render a generic gate as a labeled box."""
-        group = VGroup()
-
         # Find y range for multi-qubit gates
         y_values = [wire_positions.get(w, 0) for w in self.target_wires]
         y_min, y_max = min(y_values), max(y_values)
@@ -354,84 +404,83 @@ class QuantumGate(VGroup):
             stroke_color=self.style.gate_stroke_color,
             stroke_width=self.style.gate_stroke_width,
         )
-        box.move_to(np.array([x, y_center, 0]))
-
-        group.add(box)
+        box.move_to([x, y_center, 0])
 
         # Always use MathTex for gate labels
-        label = MathTex(self.name, color=self.style.gate_text_color)
-        label.scale(self.style.gate_font_scale)
-        label.move_to(np.array([x, y_center, 0]))
-        group.add(label)
+        label = cached_math_tex(self.name, color=self.style.gate_text_color)
+        place_scaled(label, self.style.gate_font_scale, [x, y_center, 0])
 
         self._mask_width = self.style.gate_width
 
-        return group
+        return VGroup(box, label)
 
     def _create_gate_label(self) -> VGroup | MathTex:
         """Create the gate label for parameterized and non-parameterized gates."""
-        # Check if this is a parameterized rotation gate
-        if self.name in {"RX", "RY", "RZ"} and self.params:
-            angle = self.params[0]
-
-            # If angle is a string, render the whole thing as LaTeX
-            if isinstance(angle, str):
-                label_text = f"{self.name}({angle})"
-                return MathTex(label_text, color=self.style.gate_text_color)
-
-            # Create hybrid label with MathTex components
-            gate_name_label = MathTex(f"{self.name}(", color=self.style.gate_text_color)
-
-            # Use LaTeX for special values
-            if abs(angle - np.pi) < 0.01:
-                angle_str = r"\pi"
-            elif abs(angle - np.pi / 2) < 0.01:
-                angle_str = r"\frac{\pi}{2}"
-            elif abs(angle - np.pi / 4) < 0.01:
-                angle_str = r"\frac{\pi}{4}"
-            else:
-                angle_str = f"{angle:.2f}"
-            param_label = MathTex(angle_str, color=self.style.gate_text_color)
-            closing_paren = MathTex(")", color=self.style.gate_text_color)
-
-            # Combine labels
-            hybrid_label = VGroup(gate_name_label, param_label, closing_paren)
-            hybrid_label.arrange(buff=0.02)
-            return hybrid_label
-
-        # For non-parameterized gates, always use MathTex
-        label_text = self._get_gate_label()
-        return MathTex(label_text, color=self.style.gate_text_color)
+        labels = [
+            cached_math_tex(part, color=self.style.gate_text_color)
+            for part in _label_parts(self._label_name(), self._label_angle())
+        ]
+        if len(labels) == 1:
+            return labels[0]
+
+        # Hybrid label for numeric angles: "RX(", angle, ")"
+        hybrid_label = VGroup(*labels)
+        hybrid_label.arrange(buff=0.02)
+        return hybrid_label
 
     def _get_gate_label(self) -> str:
         """Get the display label for the gate."""
-        # Handle dagger gates with proper LaTeX symbol
-        if self.name == "Sdg":
-            return r"S^{\dagger}"
-        elif self.name == "Tdg":
-            return r"T^{\dagger}"
-
-        # Handle rotation gates with parameters
-        if self.name in {"RX", "RY", "RZ"} and self.params:
-            angle = self.params[0]
-            # If angle is a string, use it directly
-            if isinstance(angle, str):
-                return f"{self.name}({angle})"
-
-            # Format angle nicely with LaTeX for common values
-            if abs(angle - np.pi) < 0.01:
-                angle_str = r"\pi"
-            elif abs(angle - np.pi / 2) < 0.01:
-                angle_str = r"\frac{\pi}{2}"
-            elif abs(angle - np.pi / 4) < 0.01:
-                angle_str = r"\frac{\pi}{4}"
-            else:
-                angle_str = f"{angle:.2f}"
-
-            return f"{self.name}({angle_str})"
+        return "".join(_label_parts(self._label_name(), self._label_angle()))
 
+    def _label_name(self) -> str:
+        """Return the gate name shown in the label (the target gate for controlled gates)."""
+        if self._RENDERERS.get(self.name) == "_render_controlled_gate":
+            return self.name[1:]  # Remove "C" prefix
         return self.name
 
+    def _label_angle(self) -> float | str | None:
+        """Return the angle shown in the label, or None if the gate has none."""
+        if self._label_name() in _ROTATION_GATES and self.params:
+            return self.params[0]
+        return None
+
+    def _box_size(
+            self, label: VGroup | MathTex, scale: float = 1.0, padding: float = _LABEL_PADDING
+    ) -> tuple[float, float]:
+        """Return the (width, height) of a gate box around a label, scaled relative to a gate."""
+        return (
+            max(self.style.gate_width * scale, label.width + 2 * padding),
+            max(self.style.gate_height * scale, label.height + 2 * padding),
+        )
+
+    def update_label(self) -> None:
+        """
+        Re-render the gate label in place after its parameters changed.
+
+        Only the label is rebuilt; the gate box is resized around it if the
+        new label needs a different size, and get_mask_width() follows the
+        box. This is cheap enough to call from an updater every frame.
+        Gates whose visual does not show a parameter (CNOT, generic boxes,
+        measurements) have nothing to update.
+        """
+        if self._visual is None or self._label is None or self._box is None:
+            return
+
+        label = self._create_gate_label()
+        scale, padding = self._label_fit
+        place_scaled(label, self.style.gate_font_scale * scale, self._label.get_center())
+
+        self._visual[self._visual.submobjects.index(self._label)] = label
+        self._label = label
+
+        box = self._box
+        box_width, box_height = self._box_size(label, scale, padding)
+        if not np.isclose(box.width, box_width):
+            box.stretch_to_fit_width(box_width)
+            self._mask_width = max(self.style.gate_width, box_width)
+        if not np.isclose(box.height, box_height):
+            box.stretch_to_fit_height(box_height)
+
     def get_mask_width(self) -> float:
         """Get the width to mask on wires under this gate."""
         return self._mask_width
@@ -2,18 +2,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import numpy as np
 from manim import (
-    LEFT,
-    Line,
+    RIGHT,
     MathTex,
     VGroup,
+    VMobject,
 )
 
-if TYPE_CHECKING:
-    from manim_quantum.styles import QuantumStyle
+from manim_quantum._tex import place_scaled
+from manim_quantum.styles import QuantumStyle, StylePresets
 
 
 class QuantumWire(VGroup):
@@ -44,7 +42,7 @@ class QuantumWire(VGroup):
             x_end: float,
             y: float,
             label: str | None = None,
-            style: "QuantumStyle | None" = None,
+            style: QuantumStyle | None = None,
     ) -> None:
         super().__init__()
 
@@ -54,29 +52,59 @@ class QuantumWire(VGroup):
         self.y = y
         self.label_text = label
 
-        # Import here to avoid circular imports
-        from manim_quantum.styles import QuantumStyle
-        self.style = style or QuantumStyle()
+        self.style = style or StylePresets.default()
 
-        # Masked regions: list of (center_x, half_width)
-        self._masked_regions: list[tuple[float, float]] = []
+        # Masked regions as (center_x, half_width) rows; the buffer grows
+        # by doubling and only the first _num_masks rows are in use
+        self._mask_buffer = np.empty((8, 2))
+        self._num_masks = 0
 
-        # Wire segments
-        self._segments: list[Line] = []
+        # Visible wire, one subpath per segment between masks
+        self._line = self._make_line([(self.x_start, self.x_end)])
         self._label: MathTex | None = None
 
         self._build_initial()
 
+    @classmethod
+    def build_batch(
+            cls,
+            num_wires: int,
+            x_start: float,
+            x_end: float,
+            wire_spacing: float,
+            labels: list[str] | None = None,
+            style: QuantumStyle | None = None,
+    ) -> list[QuantumWire]:
+        """
+        Create a stack of evenly spaced wires.
+
+        Wire i is placed at y = -i * wire_spacing. All y-coordinates are
+        computed in one NumPy operation before the wires are constructed.
+
+        Args:
+            num_wires: Number of wires to create.
+            x_start: Left x-coordinate of every wire.
+            x_end: Right x-coordinate of every wire.
+            wire_spacing: Vertical spacing between wires.
+            labels: Optional labels, one per wire (missing entries get none).
+            style: Visual style configuration.
+
+        Returns:
+            List of wires ordered by index.
+        """
+        labels = labels or []
+        ys = -np.arange(num_wires) * wire_spacing
+        return [
+            cls(
+                index=i, x_start=x_start, x_end=x_end, y=float(y),
+                label=labels[i] if i < len(labels) else None, style=style,
+            )
+            for i, y in enumerate(ys)
+        ]
+
     def _build_initial(self) -> None:
-        """Build the initial wire (single line)."""
-        line = Line(
-            start=np.array([self.x_start, self.y, 0]),
-            end=np.array([self.x_end, self.y, 0]),
-            color=self.style.wire_color,
-            stroke_width=self.style.wire_stroke_width,
-        )
-        self._segments.append(line)
-        self.add(line)
+        """Add the initial wire (single line) and its label."""
+        self.add(self._line)
 
         # Add label if provided
         if self.label_text:
@@ -85,23 +113,50 @@ class QuantumWire(VGroup):
                 self.label_text,
                 color=self.style.wire_label_color,
             )
-            self._label.scale(self.style.wire_label_scale)
-            self._label.next_to(
-                np.array([self.x_start, self.y, 0]),
-                LEFT,
-                buff=self.style.wire_label_buff,
+            # Right edge of the label sits wire_label_buff left of the wire start
+            place_scaled(
+                self._label,
+                self.style.wire_label_scale,
+                [self.x_start - self.style.wire_label_buff, self.y, 0],
+                edge=RIGHT,
             )
             self.add(self._label)
 
-    def mask_region(self, center_x: float, half_width: float) -> None:
+    def mask_region(self, center_x: float, half_width: float) -> int:
         """
         Mark a region to be masked (where a gate will be drawn).
 
         Args:
             center_x: Center x-coordinate of the mask.
             half_width: Half-width of the mask region.
+
+        Returns:
+            Index of the mask, for resize_mask().
         """
-        self._masked_regions.append((center_x, half_width))
+        if self._num_masks == len(self._mask_buffer):
+            self._mask_buffer = np.concatenate(
+                [self._mask_buffer, np.empty_like(self._mask_buffer)]
+            )
+        self._mask_buffer[self._num_masks] = (center_x, half_width)
+        self._num_masks += 1
+        return self._num_masks - 1
+
+    def resize_mask(self, index: int, half_width: float) -> None:
+        """
+        Change the half-width of a masked region, keeping its center.
+
+        Call rebuild_segments() afterwards to update the visible wire.
+
+        Args:
+            index: Index returned by mask_region().
+            half_width: New half-width of the mask region.
+        """
+        self._mask_buffer[index, 1] = half_width
+
+    @property
+    def _masked_regions(self) -> list[tuple[float, float]]:
+        """Masked regions as a list of (center_x, half_width) tuples."""
+        return [tuple(row) for row in self._mask_buffer[:self._num_masks].tolist()]
 
     def shift_masks(self, offset: float) -> None:
         """
@@ -110,10 +165,7 @@ class QuantumWire(VGroup):
         Args:
             offset: The x-offset to apply to all masked regions.
         """
-        self._masked_regions = [
-            (center_x + offset, half_width)
-            for center_x, half_width in self._masked_regions
-        ]
+        self._mask_buffer[:self._num_masks, 0] += offset
 
     def rebuild_segments(self) -> None:
         """
@@ -122,66 +174,46 @@ class QuantumWire(VGroup):
         This should be called after all gates have been added to properly
         show wire breaks at gate positions.
         """
-        # Remove old segments
-        for seg in self._segments:
-            self.remove(seg)
-        self._segments.clear()
-
-        if not self._masked_regions:
-            # No masks, single line
-            line = Line(
-                start=np.array([self.x_start, self.y, 0]),
-                end=np.array([self.x_end, self.y, 0]),
-                color=self.style.wire_color,
-                stroke_width=self.style.wire_stroke_width,
-            )
-            self._segments.append(line)
-            self.add(line)
-            return
-
-        # Sort masked regions by x position
-        sorted_masks = sorted(self._masked_regions, key=lambda m: m[0])
-
-        # Build segments between masks
-        current_x = self.x_start
-        for center_x, half_width in sorted_masks:
-            mask_start = center_x - half_width
-            mask_end = center_x + half_width
-
-            # Segment before this mask
-            if current_x < mask_start:
-                line = Line(
-                    start=np.array([current_x, self.y, 0]),
-                    end=np.array([mask_start, self.y, 0]),
-                    color=self.style.wire_color,
-                    stroke_width=self.style.wire_stroke_width,
-                )
-                self._segments.append(line)
-                self.add(line)
-
-            current_x = mask_end
-
-        # Final segment after last mask
-        if current_x < self.x_end:
-            line = Line(
-                start=np.array([current_x, self.y, 0]),
-                end=np.array([self.x_end, self.y, 0]),
-                color=self.style.wire_color,
-                stroke_width=self.style.wire_stroke_width,
-            )
-            self._segments.append(line)
-            self.add(line)
+        # Replace the old line in place so it keeps its position among the submobjects
+        line = self._make_line(self._segment_spans())
+        self.submobjects[self.submobjects.index(self._line)] = line
+        self._line = line
+
+    def _segment_spans(self) -> list[tuple[float, float]]:
+        """Return the (start_x, end_x) spans of the wire left visible by the masks."""
+        if not self._num_masks:
+            return [(self.x_start, self.x_end)]
+
+        # Sort the masks from left to right; each gap runs from the end of
+        # the previous mask (or the wire start) to the start of the next one
+        masks = self._mask_buffer[:self._num_masks]
+        masks = masks[np.argsort(masks[:, 0], kind="stable")]
+        mask_starts = masks[:, 0] - masks[:, 1]
+        mask_ends = masks[:, 0] + masks[:, 1]
+        starts = np.concatenate([[self.x_start], mask_ends])
+        ends = np.concatenate([mask_starts, [self.x_end]])
+        keep = starts < ends
+        return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+    def _make_line(self, spans: list[tuple[float, float]]) -> VMobject:
+        """Create the wire as a single mobject with one straight subpath per span."""
+        line = VMobject(
+            color=self.style.wire_color,
+            stroke_width=self.style.wire_stroke_width,
+        )
+        for start_x, end_x in spans:
+            line.start_new_path(np.array([start_x, self.y, 0.0]))
+            line.add_line_to(np.array([end_x, self.y, 0.0]))
+        return line
 
     def highlight(self, color=None) -> None:
         """Highlight the wire with a different color."""
         color = color or self.style.highlight_color
-        for seg in self._segments:
-            seg.set_color(color)
+        self._line.set_color(color)
 
     def reset_highlight(self) -> None:
         """Reset wire color to default."""
-        for seg in self._segments:
-            seg.set_color(self.style.wire_color)
+        self._line.set_color(self.style.wire_color)
 
     def get_point_at_x(self, x: float) -> np.ndarray:
         """Get the 3D point on this wire at a given x-coordinate."""
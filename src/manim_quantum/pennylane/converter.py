@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import inspect
+import warnings
+from collections import OrderedDict
+from functools import cache
+from numbers import Real
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -48,6 +53,156 @@ CIRCUIT_CONFIG_KEYS = {
     "compress", "center"
 }
 
+# Recently converted circuits, keyed by tape and layout (see circuit_from_qnode)
+_CIRCUIT_CACHE: OrderedDict[tuple, QuantumCircuit] = OrderedDict()
+_CIRCUIT_CACHE_SIZE = 16
+
+# Gate specification passed to QuantumCircuit.add_gates(): (name, wires, params, param_name)
+_GateSpec = tuple[str, list[int], list[float | str] | None, str | None]
+
+# Offset added to a QNode argument to find the operations that take it as a parameter
+_PROBE_OFFSET = 0.123456789
+
+
+@cache
+def _require_pennylane() -> None:
+    """
+    Check once that PennyLane is importable.
+
+    PennyLane is only imported on first use, so importing manim_quantum stays
+    fast for users who never convert a QNode.
+
+    Raises:
+        ImportError: If PennyLane is not installed.
+    """
+    try:
+        import pennylane  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "PennyLane is required for this feature. "
+            "Install it with: pip install pennylane"
+        )
+
+
+def _tape_key(tape: Any) -> Any:
+    """Return a hashable key identifying the operations and measurements of a tape."""
+    tape_hash = getattr(tape, "hash", None)
+    if tape_hash is not None:
+        return tape_hash
+    return (
+        tuple(
+            (op.name, tuple(op.wires), tuple(map(float, op.parameters)))
+            for op in tape.operations
+        ),
+        tuple(tuple(getattr(m, "wires", ())) for m in tape.measurements),
+    )
+
+
+def clear_circuit_cache() -> None:
+    """Drop all circuits cached by circuit_from_qnode()."""
+    _CIRCUIT_CACHE.clear()
+
+
+def _tape_gates(
+        tape: Any, param_names: tuple[str | None, ...] | None = None
+) -> list[_GateSpec]:
+    """
+    Convert the operations of a tape to (name, wires, params, param_name) specs.
+
+    Args:
+        tape: Tape recorded from a QNode.
+        param_names: Optional QNode argument name bound to the first parameter
+            of each operation, in tape order (see _parameter_names()).
+
+    Returns:
+        One gate specification per operation, in tape order.
+    """
+    gate_map = PENNYLANE_GATE_MAP
+    gates: list[_GateSpec] = []
+    for i, op in enumerate(tape.operations):
+        # Parameters as floats, or None for gates without parameters
+        params: list[float | str] | None = list(map(float, op.parameters)) or None
+        param_name = param_names[i] if param_names and params else None
+        gates.append((gate_map.get(op.name, op.name), list(op.wires), params, param_name))
+    return gates
+
+
+def _measurement_gates(tape: Any) -> list[_GateSpec]:
+    """Return one Measure gate specification per measured wire of a tape."""
+    return [
+        ("Measure", [wire], None, None)
+        for measurement in tape.measurements
+        if getattr(measurement, "wires", None)
+        for wire in measurement.wires
+    ]
+
+
+def _parameter_names(
+        qnode: QNodeProtocol, tape: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[str | None, ...]:
+    """
+    Find the QNode argument passed straight through as each operation's first parameter.
+
+    Every scalar argument is perturbed in turn and the tape is recorded
+    again; an operation is bound to the argument only if its first
+    parameter follows the argument exactly. Operations whose parameter is
+    a constant that happens to equal an argument are left unbound, as are
+    parameters derived from arguments (e.g. 2 * theta), which are reported
+    with a warning since set_parameter() cannot update them.
+
+    Args:
+        qnode: The QNode the tape was recorded from.
+        tape: Tape recorded with args and kwargs.
+        args: Positional arguments of the QNode.
+        kwargs: Keyword arguments of the QNode.
+
+    Returns:
+        The bound argument name (or None) of each operation, in tape order.
+    """
+    operations = tape.operations
+    names: list[str | None] = [None] * len(operations)
+    try:
+        bound = inspect.signature(getattr(qnode, "func", qnode)).bind_partial(*args, **kwargs)
+    except (TypeError, ValueError):
+        return tuple(names)
+
+    first_params = [float(op.parameters[0]) if op.parameters else None for op in operations]
+    derived: set[int] = set()
+    for name, value in list(bound.arguments.items()):
+        if not isinstance(value, Real) or isinstance(value, bool):
+            continue
+
+        probe = float(value) + _PROBE_OFFSET
+        bound.arguments[name] = probe
+        try:
+            probed_operations = qnode.construct(bound.args, bound.kwargs).operations
+        finally:
+            bound.arguments[name] = value
+        if len(probed_operations) != len(operations):
+            # The circuit structure depends on the argument; nothing to bind
+            continue
+
+        for i, (op, param) in enumerate(zip(probed_operations, first_params)):
+            if param is None or float(op.parameters[0]) == param:
+                continue
+            if (
+                    param == float(value) and float(op.parameters[0]) == probe
+                    and names[i] is None and i not in derived
+            ):
+                names[i] = name
+            else:
+                # Depends on the argument in some other way (or on several)
+                names[i] = None
+                derived.add(i)
+
+    if derived:
+        warnings.warn(
+            f"{len(derived)} gate parameter(s) are computed from QNode arguments "
+            "rather than passed through directly; set_parameter() cannot update them.",
+            stacklevel=3,
+        )
+    return tuple(names)
+
 
 def circuit_from_qnode(
         qnode: QNodeProtocol,
@@ -64,8 +219,19 @@ def circuit_from_qnode(
     """
     Convert a PennyLane QNode to a manim-quantum QuantumCircuit.
 
-    This function executes the QNode with the given arguments to extract
-    the circuit structure, then creates a visual representation.
+    This function records the QNode's tape with the given arguments to
+    extract the circuit structure, then creates a visual representation.
+    The device is never executed, so no state simulation is run.
+
+    Gate parameters that are a scalar QNode argument passed straight
+    through are bound to that argument's name, so they can later be updated
+    in place with ``circuit.set_parameter(name, value)``. The bindings are
+    found by recording the tape again with each scalar argument perturbed.
+
+    The most recent conversions are cached by QNode, tape and layout
+    options, so converting the same QNode with the same arguments again
+    returns a copy of the cached circuit (bindings included) instead of
+    probing and rendering it anew.
 
     Args:
         qnode: A PennyLane QNode function.
@@ -92,13 +258,7 @@ def circuit_from_qnode(
         ...     return qml.expval(qml.PauliZ(0))
         >>> circuit = circuit_from_qnode(my_circuit, 0.5)  # type: ignore[arg-type]
     """
-    try:
-        import pennylane as qml
-    except ImportError:
-        raise ImportError(
-            "PennyLane is required for this feature. "
-            "Install it with: pip install pennylane"
-        )
+    _require_pennylane()
 
     from manim_quantum.circuits.circuit import QuantumCircuit
 
@@ -106,8 +266,21 @@ def circuit_from_qnode(
     # Only pass kwargs that are meant for the QNode (not circuit config)
     tape = qnode.construct(args, kwargs)
 
+    # Reuse a recent conversion of the same tape with the same layout. The
+    # parameter bindings are part of the cached circuit, and they only depend
+    # on the QNode function besides the tape, so hits skip the probing below.
+    cache_key = (
+        getattr(qnode, "func", qnode), _tape_key(tape), repr(style),
+        tuple(wire_labels or ()), x_start, x_end, wire_spacing, compress, center,
+    )
+    cached = _CIRCUIT_CACHE.get(cache_key)
+    if cached is not None:
+        _CIRCUIT_CACHE.move_to_end(cache_key)
+        return cached.copy()
+
     # Determine number of qubits
     num_wires = len(tape.wires)
+    param_names = _parameter_names(qnode, tape, args, kwargs)
 
     # Create the circuit with configuration options
     circuit = QuantumCircuit(
@@ -121,25 +294,14 @@ def circuit_from_qnode(
         center=center,
     )
 
-    # Add gates from the tape
-    for op in tape.operations:
-        gate_name = PENNYLANE_GATE_MAP.get(op.name, op.name)
-        wires = list(op.wires)
-
-        # Extract parameters if any
-        params: list[float | str] | None = None
-        if op.parameters:
-            params = [float(p) for p in op.parameters]
-
-        circuit.add_gate(gate_name, wires, params)
-
-    # Add measurements
-    for measurement in tape.measurements:
-        if hasattr(measurement, 'wires') and measurement.wires:
-            for wire in measurement.wires:
-                circuit.add_gate("Measure", [wire])
+    # Add all gates and measurements from the tape in one batch
+    circuit.add_gates(_tape_gates(tape, param_names) + _measurement_gates(tape))
+    circuit.build()
 
-    return circuit.build()
+    _CIRCUIT_CACHE[cache_key] = circuit
+    if len(_CIRCUIT_CACHE) > _CIRCUIT_CACHE_SIZE:
+        _CIRCUIT_CACHE.popitem(last=False)
+    return circuit.copy()
 
 
 def operations_from_qnode(
@@ -158,22 +320,9 @@ def operations_from_qnode(
     Returns:
         List of (gate_name, wires, params) tuples.
     """
-    try:
-        import pennylane as qml
-    except ImportError:
-        raise ImportError(
-            "PennyLane is required for this feature. "
-            "Install it with: pip install pennylane"
-        )
+    _require_pennylane()
 
     # Use construct() to get the tape (works with PennyLane 0.44.0+)
     tape = qnode.construct(args, kwargs)
 
-    operations: list[tuple[str, list[int], list[float | str] | None]] = []
-    for op in tape.operations:
-        gate_name = PENNYLANE_GATE_MAP.get(op.name, op.name)
-        wires = list(op.wires)
-        params: list[float | str] | None = [float(p) for p in op.parameters] if op.parameters else None
-        operations.append((gate_name, wires, params))
-
-    return operations
+    return [(name, wires, params) for name, wires, params, _ in _tape_gates(tape)]
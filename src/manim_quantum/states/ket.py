@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from manim import VGroup
 
-from manim import MathTex, VGroup
-
-if TYPE_CHECKING:
-    from manim_quantum.styles import QuantumStyle
+from manim_quantum._tex import cached_math_tex
+from manim_quantum.styles import QuantumStyle, StylePresets
 
 
 class KetLabel(VGroup):
@@ -26,22 +24,20 @@ class KetLabel(VGroup):
     def __init__(
             self,
             content: str,
-            style: "QuantumStyle | None" = None,
+            style: QuantumStyle | None = None,
     ) -> None:
         super().__init__()
 
         self.content = content
 
-        # Import here to avoid circular imports
-        from manim_quantum.styles import QuantumStyle
-        self.style = style or QuantumStyle()
+        self.style = style or StylePresets.default()
 
         self._build()
 
     def _build(self) -> None:
         """Build the ket label."""
         # Kets always use LaTeX for proper mathematical notation
-        tex = MathTex(
+        tex = cached_math_tex(
             f"|{self.content}\\rangle",
             color=self.style.ket_color,
         )
@@ -2,22 +2,73 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+from collections import OrderedDict
+from typing import Hashable, NamedTuple
 
 import numpy as np
 from manim import (
     DOWN,
     LEFT,
     RIGHT,
-    MathTex,
     Rectangle,
     VGroup,
 )
 
+from manim_quantum._tex import cached_math_tex
 from manim_quantum.states.ket import KetLabel
+from manim_quantum.styles import QuantumStyle, StylePresets
+
+# Amplitudes with a dedicated label, as real and purely imaginary values.
+# Kets with amplitude 1 are shown without a coefficient.
+_SPECIAL_REAL_VALUES = (1.0, -1.0, 1 / np.sqrt(2), -1 / np.sqrt(2), 0.5, -0.5)
+_SPECIAL_IMAG_VALUES = (1.0, -1.0)
+_SPECIAL_LABELS = (
+    "", "-", r"\frac{1}{\sqrt{2}}", r"-\frac{1}{\sqrt{2}}", r"\frac{1}{2}", r"-\frac{1}{2}",
+    "i", "-i",
+)
+
+
+class _SparseAmplitudes(NamedTuple):
+    """Amplitudes of a state given only at its non-zero basis states."""
+
+    indices: np.ndarray
+    values: np.ndarray
+    size: int
+
+
+def _bell(indices: tuple[int, int], sign: float) -> _SparseAmplitudes:
+    """Return (|a⟩ + sign·|b⟩)/√2 for the two-qubit basis states a and b."""
+    values = np.array([1.0, sign], dtype=complex) / np.sqrt(2)
+    return _SparseAmplitudes(indices=np.array(indices), values=values, size=4)
+
 
-if TYPE_CHECKING:
-    from manim_quantum.styles import QuantumStyle
+# The four Bell states, built once at import
+_BELL_STATES = {
+    "phi+": _bell((0, 3), 1.0),  # (|00⟩ + |11⟩)/√2
+    "phi-": _bell((0, 3), -1.0),  # (|00⟩ - |11⟩)/√2
+    "psi+": _bell((1, 2), 1.0),  # (|01⟩ + |10⟩)/√2
+    "psi-": _bell((1, 2), -1.0),  # (|01⟩ - |10⟩)/√2
+}
+
+
+def _probabilities(amplitudes: np.ndarray) -> np.ndarray:
+    """Return |a|^2 for each amplitude without the sqrt of np.abs."""
+    return amplitudes.real ** 2 + amplitudes.imag ** 2
+
+
+def _basis_labels(indices: np.ndarray, num_qubits: int) -> list[str]:
+    """Format basis state indices as zero-padded binary strings, all at once."""
+    indices = np.asarray(indices, dtype=np.int64)
+    width = max(num_qubits, 1)
+    if indices.size and indices.max() >> width:
+        # Index wider than num_qubits; format() widens the label instead of truncating
+        return [format(i, f'0{num_qubits}b') for i in indices.tolist()]
+
+    # One ASCII digit per bit, most significant first, read back as fixed-width strings
+    shifts = np.arange(width - 1, -1, -1)
+    digits = ((indices[:, None] >> shifts) & 1).astype(np.uint8) + ord("0")
+    return digits.view(f"S{width}").ravel().astype(f"U{width}").tolist()
 
 
 class StateVector(VGroup):
@@ -29,8 +80,15 @@ class StateVector(VGroup):
     Args:
         amplitudes: Complex amplitudes for each basis state.
         show_probabilities: If True, show probability bars instead of amplitudes.
-        num_qubits: Number of qubits (auto-detected if None).
+        num_qubits: Number of qubits (auto-detected if None, which requires a
+            power-of-2 number of amplitudes).
         style: Visual style configuration.
+        min_probability: If set, probability bars are only drawn for basis
+            states with at least this probability. The default None draws
+            a bar for every basis state, zero or not, so 2^n bars; pass a
+            small positive threshold (e.g. 1e-10) to draw only the occupied
+            states, which for the sparse factory states (basis, Bell, GHZ)
+            also skips expanding the full amplitude array.
 
     Example:
         >>> import numpy as np
@@ -38,29 +96,74 @@ class StateVector(VGroup):
         >>> bell = StateVector.bell_state("phi+")
     """
 
+    # Built states shared by the factory classmethods, least recently used
+    # first, see _from_cache()
+    _cache: OrderedDict[tuple, StateVector] = OrderedDict()
+    _cache_size = 32
+
     def __init__(
             self,
             amplitudes: list[complex] | np.ndarray,
             show_probabilities: bool = False,
             num_qubits: int | None = None,
-            style: "QuantumStyle | None" = None,
+            style: QuantumStyle | None = None,
+            min_probability: float | None = None,
     ) -> None:
         super().__init__()
 
-        self.amplitudes = np.array(amplitudes, dtype=complex)
+        # Sparse states from the factory methods only expand on demand
+        if isinstance(amplitudes, _SparseAmplitudes):
+            self._sparse: _SparseAmplitudes | None = amplitudes
+            self._amplitudes: np.ndarray | None = None
+            size = amplitudes.size
+        else:
+            self.amplitudes = amplitudes
+            size = len(self.amplitudes)
         self.show_probabilities = show_probabilities
+        self.min_probability = min_probability
 
-        # Import here to avoid circular imports
-        from manim_quantum.styles import QuantumStyle
-        self.style = style or QuantumStyle()
+        self.style = style or StylePresets.default()
 
         # Determine number of qubits
         if num_qubits is None:
-            num_qubits = int(np.log2(len(self.amplitudes)))
+            num_qubits = (size - 1).bit_length()
+            if size != 1 << num_qubits:
+                raise ValueError(
+                    f"Cannot infer the number of qubits from {size} amplitudes; "
+                    "expected a power of 2"
+                )
         self.num_qubits = num_qubits
 
         self._build()
 
+    @property
+    def amplitudes(self) -> np.ndarray:
+        """Complex amplitudes for each basis state."""
+        amplitudes = self._amplitudes
+        if amplitudes is None:
+            # Only sparse states are left unexpanded
+            sparse = self._sparse
+            assert sparse is not None
+            amplitudes = self._amplitudes = np.zeros(sparse.size, dtype=complex)
+            amplitudes[sparse.indices] = sparse.values
+        return amplitudes
+
+    @amplitudes.setter
+    def amplitudes(self, amplitudes: list[complex] | np.ndarray) -> None:
+        self._amplitudes = np.array(amplitudes, dtype=complex)
+        self._sparse = None
+
+    def _nonzero_amplitudes(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the indices and values of the non-zero amplitudes."""
+        if self._sparse is not None:
+            indices, values = self._sparse.indices, self._sparse.values
+        else:
+            amplitudes = self.amplitudes
+            indices = np.flatnonzero(amplitudes)
+            values = amplitudes[indices]
+        keep = np.abs(values) >= 1e-10
+        return indices[keep], values[keep]
+
     def _build(self) -> None:
         """Build the state vector visualization."""
         if self.show_probabilities:
@@ -72,20 +175,19 @@ class StateVector(VGroup):
         """Build amplitude-based display (ket notation)."""
         terms = []
 
-        for i, amp in enumerate(self.amplitudes):
-            if abs(amp) < 1e-10:
-                continue
+        # Format all non-zero amplitudes in one pass
+        nonzero, values = self._nonzero_amplitudes()
+        amp_strs = self._format_amplitudes(values)
 
-            # Format amplitude
-            amp_str = self._format_amplitude(amp)
+        bases = _basis_labels(nonzero, self.num_qubits)
 
+        for amp_str, basis in zip(amp_strs, bases):
             # Create basis state label
-            basis = format(i, f'0{self.num_qubits}b')
             ket = KetLabel(basis, style=self.style)
 
             if amp_str:
                 # Always use MathTex for amplitude labels
-                amp_label = MathTex(amp_str, color=self.style.amplitude_color)
+                amp_label = cached_math_tex(amp_str, color=self.style.amplitude_color)
                 term = VGroup(amp_label, ket)
                 term.arrange(RIGHT, buff=0.05)
             else:
@@ -95,14 +197,14 @@ class StateVector(VGroup):
 
         if not terms:
             # Zero state
-            zero_label = MathTex("0", color=self.style.amplitude_color)
+            zero_label = cached_math_tex("0", color=self.style.amplitude_color)
             terms.append(zero_label)
 
         # Arrange terms with + signs
         full_expr = VGroup()
         for i, term in enumerate(terms):
             if i > 0:
-                plus = MathTex("+", color=self.style.amplitude_color)
+                plus = cached_math_tex("+", color=self.style.amplitude_color)
                 plus.scale(0.8)
                 full_expr.add(plus)
             full_expr.add(term)
@@ -112,22 +214,37 @@ class StateVector(VGroup):
 
     def _build_probability_bars(self) -> None:
         """Build probability bar visualization."""
-        probabilities = np.abs(self.amplitudes) ** 2
-
-        bar_group = VGroup()
+        rows = []
         max_bar_width = 2.0
         bar_height = 0.3
 
-        for i, prob in enumerate(probabilities):
+        if self.min_probability is None:
+            probabilities = _probabilities(self.amplitudes)
+            shown = np.arange(len(probabilities))
+        else:
+            # Only visit the basis states above the threshold; for a positive
+            # threshold a sparse state never needs its zero amplitudes
+            if self._sparse is not None and self.min_probability > 0:
+                shown, values = self._sparse.indices, self._sparse.values
+            else:
+                shown, values = np.arange(len(self.amplitudes)), self.amplitudes
+            probabilities = _probabilities(values)
+            keep = probabilities >= self.min_probability
+            shown, probabilities = shown[keep], probabilities[keep]
+
+        # Probability bars scale linearly with probability (1.0 = max_bar_width)
+        bar_widths = np.maximum(probabilities * max_bar_width, 0.02)
+
+        for prob, bar_width, basis in zip(
+                probabilities.tolist(), bar_widths.tolist(), _basis_labels(shown, self.num_qubits)
+        ):
             # Basis state label
-            basis = format(i, f'0{self.num_qubits}b')
             ket = KetLabel(basis, style=self.style)
             ket.scale(0.7)
 
-            # Probability bar - scales linearly with probability (1.0 = max_bar_width)
-            bar_width = prob * max_bar_width
+            # Probability bar
             bar = Rectangle(
-                width=max(bar_width, 0.02),
+                width=bar_width,
                 height=bar_height,
                 fill_color=self.style.probability_bar_color,
                 fill_opacity=0.8,
@@ -150,53 +267,106 @@ class StateVector(VGroup):
             # Probability value
             # Always use MathTex for probability labels as it's more reliable across platforms
             # (Text class can have font issues on Windows)
-            prob_label = MathTex(f"{prob:.3f}", color=self.style.probability_text_color)
+            prob_label = cached_math_tex(f"{prob:.3f}", color=self.style.probability_text_color)
             prob_label.scale(0.5)
 
             # Arrange row: probability value on left, bar container in middle, ket on right
             row = VGroup(prob_label, bar_with_container, ket)
             row.arrange(RIGHT, buff=0.2)
 
-            bar_group.add(row)
+            rows.append(row)
 
+        bar_group = VGroup(*rows)
         bar_group.arrange(DOWN, buff=0.2, aligned_edge=RIGHT)
         self.add(bar_group)
 
     @staticmethod
     def _format_amplitude(amp: complex) -> str:
         """Format a complex amplitude for display."""
-        real = amp.real
-        imag = amp.imag
-
-        # Check for special values
-        if abs(imag) < 1e-10:
-            # Real amplitude
-            if abs(real - 1) < 1e-10:
-                return ""
-            elif abs(real + 1) < 1e-10:
-                return "-"
-            # Always use LaTeX formatting for special fractions
-            elif abs(real - 1 / np.sqrt(2)) < 1e-10:
-                return r"\frac{1}{\sqrt{2}}"
-            elif abs(real + 1 / np.sqrt(2)) < 1e-10:
-                return r"-\frac{1}{\sqrt{2}}"
-            elif abs(real - 0.5) < 1e-10:
-                return r"\frac{1}{2}"
-            elif abs(real + 0.5) < 1e-10:
-                return r"-\frac{1}{2}"
-            else:
-                return f"{real:.3f}"
-        elif abs(real) < 1e-10:
-            # Pure imaginary
-            if abs(imag - 1) < 1e-10:
-                return "i"
-            elif abs(imag + 1) < 1e-10:
-                return "-i"
+        return StateVector._format_amplitudes(np.array([amp], dtype=complex))[0]
+
+    @staticmethod
+    def _format_amplitudes(amps: np.ndarray) -> list[str]:
+        """
+        Format an array of complex amplitudes for display.
+
+        The special values are classified for the whole array at once; only
+        the remaining amplitudes are formatted one by one.
+
+        Args:
+            amps: Complex amplitudes.
+
+        Returns:
+            One label per amplitude ("" for an amplitude of exactly 1).
+        """
+        real = amps.real
+        imag = amps.imag
+        is_real = np.abs(imag) < 1e-10
+        is_imag = ~is_real & (np.abs(real) < 1e-10)
+
+        conditions = [
+            is_real & (np.abs(real - value) < 1e-10) for value in _SPECIAL_REAL_VALUES
+        ] + [
+            is_imag & (np.abs(imag - value) < 1e-10) for value in _SPECIAL_IMAG_VALUES
+        ]
+        codes = np.select(conditions, range(len(conditions)), default=-1)
+
+        labels = []
+        for code, re, im, real_only, imag_only in zip(
+                codes.tolist(), real.tolist(), imag.tolist(), is_real.tolist(), is_imag.tolist()
+        ):
+            if code >= 0:
+                labels.append(_SPECIAL_LABELS[code])
+            elif real_only:
+                labels.append(f"{re:.3f}")
+            elif imag_only:
+                labels.append(f"{im:.3f}i")
             else:
-                return f"{imag:.3f}i"
+                labels.append(f"({re:.2f}{'+' if im >= 0 else ''}{im:.2f}i)")
+        return labels
+
+    @classmethod
+    def _from_cache(cls, amplitudes, num_qubits: int, **kwargs) -> StateVector:
+        """
+        Create a state vector by copying a cached one with the same state and options.
+
+        Named states are typically shown several times in a scene, and
+        building one renders every ket and amplitude label.
+
+        Args:
+            amplitudes: Complex amplitudes for each basis state.
+            num_qubits: Number of qubits.
+            **kwargs: Additional arguments for StateVector.
+
+        Returns:
+            A new StateVector.
+        """
+        state_key: tuple[Hashable, ...]
+        if isinstance(amplitudes, _SparseAmplitudes):
+            state_key = (amplitudes.indices.tobytes(), amplitudes.values.tobytes(), amplitudes.size)
+        else:
+            # Dense states are keyed by a digest, not by their (possibly huge) bytes
+            amplitudes = np.asarray(amplitudes, dtype=complex)
+            state_key = (hashlib.blake2b(amplitudes.tobytes()).digest(), amplitudes.size)
+        key = (
+            cls,
+            state_key,
+            num_qubits,
+            tuple(sorted((name, repr(value)) for name, value in kwargs.items())),
+        )
+        cached = cls._cache.get(key)
+        if cached is None:
+            cached = cls._cache[key] = cls(amplitudes, num_qubits=num_qubits, **kwargs)
+            if len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
         else:
-            # Complex
-            return f"({real:.2f}{'+' if imag >= 0 else ''}{imag:.2f}i)"
+            cls._cache.move_to_end(key)
+        return cached.copy()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached state vectors built by the factory methods."""
+        cls._cache.clear()
 
     @classmethod
     def from_basis_state(
@@ -220,11 +390,10 @@ class StateVector(VGroup):
             state = int(state, 2)
             num_qubits = max(num_qubits, len(bin(state)) - 2) if state > 0 else num_qubits
 
-        n_states = 2 ** num_qubits
-        amplitudes = np.zeros(n_states, dtype=complex)
-        amplitudes[state] = 1.0
-
-        return cls(amplitudes, num_qubits=num_qubits, **kwargs)
+        amplitudes = _SparseAmplitudes(
+            indices=np.array([state]), values=np.ones(1, dtype=complex), size=2 ** num_qubits
+        )
+        return cls._from_cache(amplitudes, num_qubits, **kwargs)
 
     @classmethod
     def superposition(cls, num_qubits: int = 1, **kwargs) -> StateVector:
@@ -240,7 +409,7 @@ class StateVector(VGroup):
         """
         n_states = 2 ** num_qubits
         amplitudes = np.ones(n_states, dtype=complex) / np.sqrt(n_states)
-        return cls(amplitudes, num_qubits=num_qubits, **kwargs)
+        return cls._from_cache(amplitudes, num_qubits, **kwargs)
 
     @classmethod
     def bell_state(
@@ -258,17 +427,8 @@ class StateVector(VGroup):
         Returns:
             StateVector representing the Bell state.
         """
-        sqrt2 = 1 / np.sqrt(2)
-
-        bell_states = {
-            "phi+": [sqrt2, 0, 0, sqrt2],  # (|00⟩ + |11⟩)/√2
-            "phi-": [sqrt2, 0, 0, -sqrt2],  # (|00⟩ - |11⟩)/√2
-            "psi+": [0, sqrt2, sqrt2, 0],  # (|01⟩ + |10⟩)/√2
-            "psi-": [0, sqrt2, -sqrt2, 0],  # (|01⟩ - |10⟩)/√2
-        }
-
-        amplitudes = bell_states.get(name.lower(), bell_states["phi+"])
-        return cls(amplitudes, num_qubits=2, **kwargs)
+        amplitudes = _BELL_STATES.get(name.lower(), _BELL_STATES["phi+"])
+        return cls._from_cache(amplitudes, 2, **kwargs)
 
     @classmethod
     def ghz_state(cls, num_qubits: int = 3, **kwargs) -> StateVector:
@@ -283,7 +443,10 @@ class StateVector(VGroup):
             StateVector representing the GHZ state.
         """
         n_states = 2 ** num_qubits
-        amplitudes = np.zeros(n_states, dtype=complex)
-        amplitudes[0] = 1 / np.sqrt(2)  # |00...0⟩
-        amplitudes[-1] = 1 / np.sqrt(2)  # |11...1⟩
-        return cls(amplitudes, num_qubits=num_qubits, **kwargs)
+        # |00...0⟩ and |11...1⟩ with equal weight
+        amplitudes = _SparseAmplitudes(
+            indices=np.array([0, n_states - 1]),
+            values=np.full(2, 1 / np.sqrt(2), dtype=complex),
+            size=n_states,
+        )
+        return cls._from_cache(amplitudes, num_qubits, **kwargs)
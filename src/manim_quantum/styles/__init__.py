@@ -3,21 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from manim import BLUE, GRAY, RED, TEAL, WHITE, YELLOW
 
 if TYPE_CHECKING:
+    from manim.utils.color import ParsableManimColor
+
     from manim_quantum.circuits.circuit import QuantumCircuit
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuantumStyle:
     """
     Configuration for visual styling of quantum circuit components.
 
     This class defines colors, sizes, and other visual properties used
-    throughout manim-quantum visualizations.
+    throughout manim-quantum visualizations. Styles are immutable; use
+    ``dataclasses.replace(style, field=value)`` to derive a modified copy.
 
     Attributes:
         wire_color: Color of quantum wires.
@@ -43,6 +46,7 @@ class QuantumStyle:
         glow_color: Color for glow animations.
         sphere_color: Color of Bloch sphere surface.
         sphere_opacity: Opacity of Bloch sphere surface.
+        sphere_stroke_width: Wireframe width of the Bloch sphere (0 hides it).
         axis_color: Color of Bloch sphere axes.
         ket_color: Color of ket notation labels.
         state_vector_color: Color of state vector arrows.
@@ -58,15 +62,15 @@ class QuantumStyle:
     """
 
     # Wire styling
-    wire_color: Any = WHITE
+    wire_color: ParsableManimColor = WHITE
     wire_stroke_width: float = 2.0
 
     # Gate box styling
-    gate_fill_color: Any = "#1a1a2e"
+    gate_fill_color: ParsableManimColor = "#1a1a2e"
     gate_fill_opacity: float = 1.0
-    gate_stroke_color: Any = WHITE
+    gate_stroke_color: ParsableManimColor = WHITE
     gate_stroke_width: float = 2.0
-    gate_text_color: Any = WHITE
+    gate_text_color: ParsableManimColor = WHITE
 
     # Gate dimensions
     gate_width: float = 0.6
@@ -76,41 +80,127 @@ class QuantumStyle:
 
     # Control/target styling
     control_dot_radius: float = 0.08
-    control_dot_color: Any = WHITE
+    control_dot_color: ParsableManimColor = WHITE
     target_radius: float = 0.25
 
     # Measurement styling
-    measurement_fill_color: Any = "#2d2d44"
+    measurement_fill_color: ParsableManimColor = "#2d2d44"
 
     # Wire label styling
-    wire_label_color: Any = WHITE
+    wire_label_color: ParsableManimColor = WHITE
     wire_label_scale: float = 0.6
     wire_label_buff: float = 0.3
 
     # Animation colors
-    highlight_color: Any = YELLOW
-    pulse_color: Any = BLUE
-    glow_color: Any = BLUE
+    highlight_color: ParsableManimColor = YELLOW
+    pulse_color: ParsableManimColor = BLUE
+    glow_color: ParsableManimColor = BLUE
 
     # Bloch sphere styling
-    sphere_color: Any = BLUE
+    sphere_color: ParsableManimColor = BLUE
     sphere_opacity: float = 0.3
-    axis_color: Any = GRAY
-    state_vector_color: Any = RED
-    state_dot_color: Any = RED
+    sphere_stroke_width: float = 0.0
+    axis_color: ParsableManimColor = GRAY
+    state_vector_color: ParsableManimColor = RED
+    state_dot_color: ParsableManimColor = RED
 
     # State vector styling
-    ket_color: Any = WHITE
-    amplitude_color: Any = WHITE
-    probability_bar_color: Any = TEAL
-    probability_bar_stroke: Any = WHITE
-    probability_text_color: Any = WHITE
+    ket_color: ParsableManimColor = WHITE
+    amplitude_color: ParsableManimColor = WHITE
+    probability_bar_color: ParsableManimColor = TEAL
+    probability_bar_stroke: ParsableManimColor = WHITE
+    probability_text_color: ParsableManimColor = WHITE
+
+
+# Keyword arguments of each named preset, built once into _PRESETS below
+_PRESET_TABLE: dict[str, dict[str, Any]] = {
+    "default": {},
+    "ibm": {
+        "wire_color": "#FFFFFF",
+        "gate_fill_color": "#6929C4",
+        "gate_stroke_color": "#BE95FF",
+        "gate_text_color": "#FFFFFF",
+        "control_dot_color": "#BE95FF",
+        "measurement_fill_color": "#1192E8",
+        "pulse_color": "#08BDBA",
+        "glow_color": "#08BDBA",
+        "sphere_color": "#6929C4",
+        "state_vector_color": "#FA4D56",
+    },
+    "google": {
+        "wire_color": "#DADCE0",
+        "gate_fill_color": "#4285F4",
+        "gate_stroke_color": "#8AB4F8",
+        "gate_text_color": "#FFFFFF",
+        "control_dot_color": "#FFFFFF",
+        "measurement_fill_color": "#34A853",
+        "pulse_color": "#FBBC04",
+        "glow_color": "#FBBC04",
+        "sphere_color": "#4285F4",
+        "state_vector_color": "#EA4335",
+    },
+    "dark": {
+        "wire_color": "#E0E0E0",
+        "gate_fill_color": "#1E1E2E",
+        "gate_stroke_color": "#89B4FA",
+        "gate_text_color": "#CDD6F4",
+        "control_dot_color": "#89B4FA",
+        "measurement_fill_color": "#313244",
+        "highlight_color": "#F9E2AF",
+        "pulse_color": "#89DCEB",
+        "glow_color": "#89DCEB",
+        "sphere_color": "#89B4FA",
+        "sphere_opacity": 0.2,
+        "state_vector_color": "#F38BA8",
+        "probability_bar_color": "#A6E3A1",
+    },
+    "light": {
+        "wire_color": "#1E1E2E",
+        "gate_fill_color": "#FFFFFF",
+        "gate_fill_opacity": 0.9,
+        "gate_stroke_color": "#1E1E2E",
+        "gate_text_color": "#1E1E2E",
+        "control_dot_color": "#1E1E2E",
+        "measurement_fill_color": "#F5F5F5",
+        "highlight_color": "#F59E0B",
+        "pulse_color": "#3B82F6",
+        "glow_color": "#3B82F6",
+        "sphere_color": "#3B82F6",
+        "sphere_opacity": 0.15,
+        "axis_color": "#6B7280",
+        "state_vector_color": "#EF4444",
+        "state_dot_color": "#EF4444",
+        "ket_color": "#1E1E2E",
+        "amplitude_color": "#1E1E2E",
+        "probability_bar_color": "#10B981",
+        "probability_bar_stroke": "#1E1E2E",
+        "probability_text_color": "#1E1E2E",
+    },
+    "pastel": {
+        "wire_color": "#6C7A89",
+        "gate_fill_color": "#FFE5EC",
+        "gate_stroke_color": "#FFB3C6",
+        "gate_text_color": "#4A5568",
+        "control_dot_color": "#FFB3C6",
+        "measurement_fill_color": "#E0F2FE",
+        "highlight_color": "#FDE68A",
+        "pulse_color": "#A5D8FF",
+        "glow_color": "#A5D8FF",
+        "sphere_color": "#C4B5FD",
+        "sphere_opacity": 0.25,
+        "state_vector_color": "#FCA5A5",
+        "probability_bar_color": "#86EFAC",
+    },
+}
 
 
 class StylePresets:
     """
     Predefined style presets for common visual themes.
 
+    Each preset is built once and the same (immutable) instance is returned
+    on every call; use ``dataclasses.replace`` to derive a customized style.
+
     Example:
         >>> circuit = QuantumCircuit(num_qubits=2, style=StylePresets.ibm())
     """
@@ -118,103 +208,59 @@ class StylePresets:
     @staticmethod
     def default() -> QuantumStyle:
         """Default style with dark theme."""
-        return QuantumStyle()
+        return _PRESETS["default"]
 
     @staticmethod
     def ibm() -> QuantumStyle:
         """IBM Quantum-inspired style."""
-        return QuantumStyle(
-            wire_color="#FFFFFF",
-            gate_fill_color="#6929C4",
-            gate_stroke_color="#BE95FF",
-            gate_text_color="#FFFFFF",
-            control_dot_color="#BE95FF",
-            measurement_fill_color="#1192E8",
-            pulse_color="#08BDBA",
-            glow_color="#08BDBA",
-            sphere_color="#6929C4",
-            state_vector_color="#FA4D56",
-        )
+        return _PRESETS["ibm"]
 
     @staticmethod
     def google() -> QuantumStyle:
         """Google Quantum AI-inspired style."""
-        return QuantumStyle(
-            wire_color="#DADCE0",
-            gate_fill_color="#4285F4",
-            gate_stroke_color="#8AB4F8",
-            gate_text_color="#FFFFFF",
-            control_dot_color="#FFFFFF",
-            measurement_fill_color="#34A853",
-            pulse_color="#FBBC04",
-            glow_color="#FBBC04",
-            sphere_color="#4285F4",
-            state_vector_color="#EA4335",
-        )
+        return _PRESETS["google"]
 
     @staticmethod
     def dark() -> QuantumStyle:
         """Dark theme with high contrast."""
-        return QuantumStyle(
-            wire_color="#E0E0E0",
-            gate_fill_color="#1E1E2E",
-            gate_stroke_color="#89B4FA",
-            gate_text_color="#CDD6F4",
-            control_dot_color="#89B4FA",
-            measurement_fill_color="#313244",
-            highlight_color="#F9E2AF",
-            pulse_color="#89DCEB",
-            glow_color="#89DCEB",
-            sphere_color="#89B4FA",
-            sphere_opacity=0.2,
-            state_vector_color="#F38BA8",
-            probability_bar_color="#A6E3A1",
-        )
+        return _PRESETS["dark"]
 
     @staticmethod
     def light() -> QuantumStyle:
         """Light theme for presentations."""
-        return QuantumStyle(
-            wire_color="#1E1E2E",
-            gate_fill_color="#FFFFFF",
-            gate_fill_opacity=0.9,
-            gate_stroke_color="#1E1E2E",
-            gate_text_color="#1E1E2E",
-            control_dot_color="#1E1E2E",
-            measurement_fill_color="#F5F5F5",
-            highlight_color="#F59E0B",
-            pulse_color="#3B82F6",
-            glow_color="#3B82F6",
-            sphere_color="#3B82F6",
-            sphere_opacity=0.15,
-            axis_color="#6B7280",
-            state_vector_color="#EF4444",
-            state_dot_color="#EF4444",
-            ket_color="#1E1E2E",
-            amplitude_color="#1E1E2E",
-            probability_bar_color="#10B981",
-            probability_bar_stroke="#1E1E2E",
-            probability_text_color="#1E1E2E",
-        )
+        return _PRESETS["light"]
 
     @staticmethod
     def pastel() -> QuantumStyle:
         """Soft pastel color scheme."""
-        return QuantumStyle(
-            wire_color="#6C7A89",
-            gate_fill_color="#FFE5EC",
-            gate_stroke_color="#FFB3C6",
-            gate_text_color="#4A5568",
-            control_dot_color="#FFB3C6",
-            measurement_fill_color="#E0F2FE",
-            highlight_color="#FDE68A",
-            pulse_color="#A5D8FF",
-            glow_color="#A5D8FF",
-            sphere_color="#C4B5FD",
-            sphere_opacity=0.25,
-            state_vector_color="#FCA5A5",
-            probability_bar_color="#86EFAC",
-        )
+        return _PRESETS["pastel"]
+
+    @staticmethod
+    def get(name: str) -> QuantumStyle:
+        """
+        Look up a preset by name.
+
+        Args:
+            name: Preset name ("default", "ibm", "google", "dark", "light" or "pastel").
+
+        Returns:
+            The shared style instance of the preset.
+
+        Raises:
+            ValueError: If no preset has the given name.
+        """
+        try:
+            return _PRESETS[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown style preset: {name!r}. Must be one of {', '.join(_PRESETS)}."
+            ) from None
+
+
+# Preset instances by name, shared by every StylePresets lookup
+_PRESETS: dict[str, QuantumStyle] = {
+    name: QuantumStyle(**params) for name, params in _PRESET_TABLE.items()
+}
 
 
 __all__ = [
@@ -2,28 +2,26 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import os
 
 import numpy as np
 import pytest
+from manim import config
+
+from manim_quantum import QuantumCircuit
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_manim_config():
+def setup_manim_config(tmp_path_factory):
     """Configure Manim for testing with temporary directories."""
-    from manim import config
-
-    # Create a temporary directory for media files
-    temp_dir = tempfile.mkdtemp()
-    media_dir = Path(temp_dir) / "media"
-    media_dir.mkdir(exist_ok=True)
+    # Media files go to a pytest-managed temporary directory, one per
+    # pytest-xdist worker so parallel runs never share a Tex cache
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    media_dir = tmp_path_factory.mktemp(f"media-{worker}")
 
     # Create necessary subdirectories
-    (media_dir / "Tex").mkdir(exist_ok=True)
-    (media_dir / "texts").mkdir(exist_ok=True)
-    (media_dir / "images").mkdir(exist_ok=True)
-    (media_dir / "videos").mkdir(exist_ok=True)
+    for subdir in ("Tex", "texts", "images", "videos"):
+        (media_dir / subdir).mkdir()
 
     # Store original config values
     original_media_dir = config.media_dir
@@ -45,21 +43,15 @@ def setup_manim_config():
     config.preview = original_preview
 
 
-@pytest.fixture(autouse=True)
-def ensure_media_dirs():
-    """Ensure media directories exist for each test."""
-    from manim import config
-
-    media_dir = Path(config.media_dir)
-
-    # Ensure all necessary subdirectories exist
-    for subdir in ["Tex", "texts", "images", "videos"]:
-        (media_dir / subdir).mkdir(parents=True, exist_ok=True)
-
-    yield
+@pytest.fixture(scope="session")
+def sample_amplitudes():
+    """Sample amplitudes for a 2-qubit state vector (shared, read-only)."""
+    amplitudes = np.array([0.5, 0.5, 0.5, 0.5])
+    amplitudes.setflags(write=False)
+    return amplitudes
 
 
 @pytest.fixture
-def sample_amplitudes():
-    """Sample amplitudes for a 2-qubit state vector."""
-    return np.array([0.5, 0.5, 0.5, 0.5])
+def circuit_2q():
+    """Empty 2-qubit circuit."""
+    return QuantumCircuit(num_qubits=2)
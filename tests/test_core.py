@@ -2,7 +2,38 @@
 
 from __future__ import annotations
 
+import dataclasses
+import math
+
 import numpy as np
+import pytest
+from manim import BLUE, LEFT, RED, RIGHT, UP, Square
+
+import manim_quantum
+from manim_quantum import (
+    BlochSphere,
+    BlochSphereRotation,
+    BlochSphereStateTransition,
+    CircuitEvaluationAnimation,
+    GateAnimation,
+    KetLabel,
+    QuantumCircuit,
+    QuantumGate,
+    QuantumWire,
+    StateVector,
+)
+from manim_quantum._tex import place_scaled
+from manim_quantum.pennylane.converter import circuit_from_qnode, clear_circuit_cache
+from manim_quantum.states.state_vector import _basis_labels
+from manim_quantum.styles import QuantumStyle, StylePresets
+
+_INV_SQRT2 = math.sqrt(0.5)
+
+# Expected states, shared by the tests and therefore read-only
+_PLUS_STATE = np.array([_INV_SQRT2, _INV_SQRT2])
+_BELL_PHI_PLUS = np.array([_INV_SQRT2, 0, 0, _INV_SQRT2])
+for _state in (_PLUS_STATE, _BELL_PHI_PLUS):
+    _state.setflags(write=False)
 
 
 class TestQuantumCircuit:
@@ -10,16 +41,12 @@ class TestQuantumCircuit:
 
     def test_circuit_creation(self):
         """Test basic circuit creation."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2)
         assert circuit.num_qubits == 2
         assert len(circuit._wires) == 2
 
     def test_circuit_with_custom_params(self):
         """Test circuit with custom parameters."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(
             num_qubits=3,
             x_start=-4,
@@ -31,65 +58,134 @@ class TestQuantumCircuit:
         assert circuit.x_end == 4
         assert circuit.wire_spacing == 1.5
 
-    def test_add_single_qubit_gate(self):
+    def test_add_single_qubit_gate(self, circuit_2q):
         """Test adding a single-qubit gate."""
-        from manim_quantum import QuantumCircuit
-
-        circuit = QuantumCircuit(num_qubits=2)
-        gate = circuit.add_gate("H", [0])
+        gate = circuit_2q.add_gate("H", [0])
 
         assert gate.name == "H"
         assert gate.target_wires == [0]
-        assert len(circuit._gates) == 1
+        assert len(circuit_2q._gates) == 1
 
-    def test_add_two_qubit_gate(self):
+    def test_add_two_qubit_gate(self, circuit_2q):
         """Test adding a two-qubit gate."""
-        from manim_quantum import QuantumCircuit
-
-        circuit = QuantumCircuit(num_qubits=2)
-        gate = circuit.add_gate("CNOT", [0, 1])
+        gate = circuit_2q.add_gate("CNOT", [0, 1])
 
         assert gate.name == "CNOT"
         assert gate.target_wires == [0, 1]
 
     def test_add_parameterized_gate(self):
         """Test adding a parameterized gate."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=1)
         gate = circuit.add_gate("RZ", [0], params=[np.pi / 4])
 
         assert gate.name == "RZ"
         assert gate.params == [np.pi / 4]
 
-    def test_add_multiple_gates(self):
-        """Test adding multiple gates at once."""
-        from manim_quantum import QuantumCircuit
+    def test_set_parameter_updates_bound_gates(self):
+        """Test updating a named parameter in place."""
+        circuit = QuantumCircuit(num_qubits=2)
+        gate = circuit.add_gate("RY", [0], params=[0.5], param_name="theta")
+        other = circuit.add_gate("RZ", [1], params=[0.5])
+        visual = circuit._gate_visuals[0]
 
+        circuit.set_parameter("theta", np.pi / 2)
+
+        assert gate.params == [np.pi / 2]
+        assert other.params == [0.5]
+        # The gate visual is updated in place, not rebuilt
+        assert circuit._gate_visuals[0] is visual
+        assert gate._label in visual.submobjects
+
+    def test_set_parameter_refits_gate_box(self):
+        """Test that the gate box and wire gap grow with a wider label."""
+        circuit = QuantumCircuit(num_qubits=1)
+        gate = circuit.add_gate("RX", [0], params=[np.pi], param_name="theta")
+        circuit.build()
+        box = gate._box
+
+        circuit.set_parameter("theta", -12.3456)
+
+        label = gate._label
+        assert box.get_left()[0] < label.get_left()[0]
+        assert label.get_right()[0] < box.get_right()[0]
+        assert np.isclose(gate.get_mask_width(), box.width)
+        # The wire gap runs from the end of the first span to the start of the second
+        (_, gap_start), (gap_end, _) = circuit.get_wire(0)._segment_spans()
+        assert np.isclose(gap_start, box.get_left()[0])
+        assert np.isclose(gap_end, box.get_right()[0])
+
+    def test_set_parameter_updates_controlled_rotation(self):
+        """Test that a bound controlled rotation relabels and refits its target box."""
         circuit = QuantumCircuit(num_qubits=2)
-        gates = circuit.add_gates([
+        gate = circuit.add_gate("CRX", [0, 1], params=[np.pi], param_name="theta")
+        circuit.build()
+        label = gate._label
+
+        circuit.set_parameter("theta", -12.3456)
+
+        assert gate.params == [-12.3456]
+        assert gate._label is not label
+        assert gate._label in circuit._gate_visuals[0].submobjects
+        assert gate._get_gate_label() == "RX(-12.35)"
+        assert gate._box.get_left()[0] < gate._label.get_left()[0]
+        assert gate._label.get_right()[0] < gate._box.get_right()[0]
+        assert np.isclose(gate.get_mask_width(), gate._box.width)
+
+    def test_get_wire_endpoint(self):
+        """Test wire endpoint lookup."""
+        circuit = QuantumCircuit(num_qubits=3, x_start=-4, x_end=4, wire_spacing=1.5)
+
+        assert np.allclose(circuit.get_wire_endpoint(2, "left"), [-4, -3, 0])
+        assert np.allclose(circuit.get_wire_endpoint(2), [4, -3, 0])
+        assert np.allclose(circuit.get_wire_endpoint(5), [0, 0, 0])
+
+        # The returned point belongs to the caller
+        point = circuit.get_wire_endpoint(2)
+        point += UP
+        assert np.allclose(circuit.get_wire_endpoint(2), [4, -3, 0])
+
+    def test_add_multiple_gates(self, circuit_2q):
+        """Test adding multiple gates at once."""
+        gates = circuit_2q.add_gates([
             ("H", [0]),
             ("CNOT", [0, 1]),
         ])
 
         assert len(gates) == 2
-        assert len(circuit._gates) == 2
+        assert len(circuit_2q._gates) == 2
 
-    def test_circuit_build(self):
-        """Test circuit build method."""
-        from manim_quantum import QuantumCircuit
+    def test_add_gates_with_param_name(self):
+        """Test that batch-added gates can be bound to a named parameter."""
+        circuit = QuantumCircuit(num_qubits=1)
+        (gate,) = circuit.add_gates([("RY", [0], [0.5], "theta")])
+        circuit.set_parameter("theta", 1.0)
 
-        circuit = QuantumCircuit(num_qubits=2)
-        circuit.add_gate("H", [0])
-        result = circuit.build()
+        assert gate.params == [1.0]
+
+    def test_circuit_build(self, circuit_2q):
+        """Test circuit build method."""
+        circuit_2q.add_gate("H", [0])
+        result = circuit_2q.build()
 
         # Should return self for chaining
-        assert result is circuit
+        assert result is circuit_2q
+
+    def test_circuit_build_adds_gate_visuals(self, circuit_2q):
+        """Test that gate visuals are added to the circuit once it is built."""
+        circuit_2q.add_gate("H", [0])
+        circuit_2q.add_gate("CNOT", [0, 1])
+
+        family = circuit_2q.get_family()
+        assert all(visual in circuit_2q.submobjects for visual in circuit_2q._gate_visuals)
+        assert all(visual in family for visual in circuit_2q._gate_visuals)
+
+        circuit_2q.add_gate("X", [1])
+        circuit_2q.build()
+        assert circuit_2q.submobjects.count(circuit_2q._gate_visuals[0]) == 1
+        assert circuit_2q._gate_visuals[-1] in circuit_2q.submobjects
 
     def test_circuit_from_operations(self):
         """Test creating circuit from operations list."""
-        from manim_quantum import QuantumCircuit
-
         operations = [
             ("H", [0], None),
             ("CNOT", [0, 1], None),
@@ -100,40 +196,60 @@ class TestQuantumCircuit:
         assert circuit.num_qubits == 2
         assert len(circuit._gates) == 3
 
-    def test_circuit_compression_disabled(self):
-        """Test circuit without compression (default behavior)."""
-        from manim_quantum import QuantumCircuit
-
-        circuit = QuantumCircuit(num_qubits=3, compress=False)
-        circuit.add_gate("H", [0])
-        circuit.add_gate("H", [1])
-        circuit.add_gate("H", [2])
-
-        # Without compression, gates should be placed sequentially
-        positions = circuit._gate_x_positions
-        assert len(positions) == 3
-        # Each gate should be at a different x position
-        assert positions[0] != positions[1]
-        assert positions[1] != positions[2]
-
-    def test_circuit_compression_enabled(self):
-        """Test circuit with compression enabled."""
-        from manim_quantum import QuantumCircuit
-
-        circuit = QuantumCircuit(num_qubits=3, compress=True)
-        circuit.add_gate("H", [0])
-        circuit.add_gate("H", [1])
-        circuit.add_gate("H", [2])
+    def test_from_operations_returns_independent_copies(self):
+        """Test that repeated from_operations() calls copy a cached circuit."""
+        QuantumCircuit.clear_cache()
+        operations = [("H", [0], None), ("CNOT", [0, 1], None)]
+        first = QuantumCircuit.from_operations(operations)
+        second = QuantumCircuit.from_operations(operations)
+
+        assert first is not second
+        assert len(QuantumCircuit._operations_cache) == 1
+
+        first.add_gate("X", [1])
+        assert len(second._gates) == 2
+
+        QuantumCircuit.clear_cache()
+        assert not QuantumCircuit._operations_cache
+
+    def test_circuit_from_arrays(self):
+        """Test creating circuit from flat gate arrays."""
+        circuit = QuantumCircuit.from_arrays(
+            ["H", "CNOT", "RZ"],
+            wire_offsets=np.array([0, 1, 3, 4]),
+            wire_flat=np.array([0, 0, 1, 1]),
+            params=[None, None, [np.pi / 2]],
+        )
 
-        # With compression, all three H gates on different wires should be at same x position
+        assert circuit.num_qubits == 2
+        assert [gate.target_wires for gate in circuit._gates] == [[0], [0, 1], [1]]
+        assert circuit._gates[2].params == [np.pi / 2]
+
+    @pytest.mark.parametrize(
+        "wire_offsets",
+        [[0, 1, 3], [0, 1, 3, 4, 4], [0, 3, 1, 4], [0, 1, 3, 5]],
+    )
+    def test_circuit_from_arrays_rejects_bad_offsets(self, wire_offsets):
+        """Test that inconsistent wire offsets are reported up front."""
+        with pytest.raises(ValueError, match="wire_offsets"):
+            QuantumCircuit.from_arrays(
+                ["H", "CNOT", "RZ"], wire_offsets=wire_offsets, wire_flat=[0, 0, 1, 1]
+            )
+
+    @pytest.mark.parametrize(("compress", "depth"), [(False, 3), (True, 1)])
+    def test_circuit_compression_depth(self, compress, depth):
+        """Test that compression parallelizes gates on different wires."""
+        circuit = QuantumCircuit(num_qubits=3, compress=compress)
+        for wire in range(3):
+            circuit.add_gate("H", [wire])
+
+        # Sequential without compression, a single layer with it
         positions = circuit._gate_x_positions
         assert len(positions) == 3
-        assert positions[0] == positions[1] == positions[2]
+        assert len(set(positions)) == depth
 
     def test_circuit_compression_parallel_gates(self):
         """Test that non-overlapping gates are parallelized."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=4, compress=True)
         circuit.add_gate("H", [0])
         circuit.add_gate("X", [1])
@@ -146,8 +262,6 @@ class TestQuantumCircuit:
 
     def test_circuit_compression_sequential_on_same_wire(self):
         """Test that gates on the same wire remain sequential."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2, compress=True)
         circuit.add_gate("H", [0])
         circuit.add_gate("X", [0])
@@ -159,8 +273,6 @@ class TestQuantumCircuit:
 
     def test_circuit_compression_cnot_blocks_wires(self):
         """Test that multi-qubit gates properly block all involved wires."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=3, compress=True)
         circuit.add_gate("CNOT", [0, 1])  # Blocks wires 0 and 1
         circuit.add_gate("H", [0])  # Must wait for CNOT
@@ -176,8 +288,6 @@ class TestQuantumCircuit:
 
     def test_circuit_compression_mixed_scenario(self):
         """Test complex scenario with mixed gate dependencies."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=4, compress=True)
         # Layer 0: All parallel
         circuit.add_gate("H", [0])
@@ -208,33 +318,8 @@ class TestQuantumCircuit:
         # Z on wire 0 must wait for CNOT, so layer 2
         assert positions[7] > positions[4]
 
-    def test_circuit_compression_depth_reduction(self):
-        """Test that compression actually reduces circuit depth."""
-        from manim_quantum import QuantumCircuit
-
-        # Without compression
-        circuit_uncompressed = QuantumCircuit(num_qubits=3, compress=False)
-        for i in range(3):
-            circuit_uncompressed.add_gate("H", [i])
-
-        # With compression
-        circuit_compressed = QuantumCircuit(num_qubits=3, compress=True)
-        for i in range(3):
-            circuit_compressed.add_gate("H", [i])
-
-        # Count unique x positions (layers)
-        uncompressed_depth = len(set(circuit_uncompressed._gate_x_positions))
-        compressed_depth = len(set(circuit_compressed._gate_x_positions))
-
-        # Compressed should have fewer layers
-        assert compressed_depth < uncompressed_depth
-        assert compressed_depth == 1  # All gates can be parallel
-        assert uncompressed_depth == 3  # All gates are sequential
-
     def test_circuit_compression_preserves_functionality(self):
         """Test that compression doesn't change gate order on same wire."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2, compress=True)
         circuit.add_gate("H", [0])
         circuit.add_gate("X", [1])
@@ -255,8 +340,6 @@ class TestQuantumCircuit:
 
     def test_circuit_center_disabled(self):
         """Test circuit with centering disabled (default)."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2, x_start=-5, x_end=5, center=False)
         circuit.add_gate("H", [0])
         circuit.build()
@@ -268,8 +351,6 @@ class TestQuantumCircuit:
 
     def test_circuit_center_enabled(self):
         """Test circuit with centering enabled."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2, x_start=-5, x_end=5, center=True)
         circuit.add_gate("H", [0])
         circuit.build()
@@ -281,8 +362,6 @@ class TestQuantumCircuit:
 
     def test_circuit_center_multiple_gates(self):
         """Test centering with multiple gates."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2, x_start=-5, x_end=5, center=True, compress=False)
         circuit.add_gate("H", [0])
         circuit.add_gate("X", [0])
@@ -297,8 +376,6 @@ class TestQuantumCircuit:
 
     def test_circuit_center_with_compression(self):
         """Test centering works with compression."""
-        from manim_quantum import QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=3, x_start=-6, x_end=6, center=True, compress=True)
         circuit.add_gate("H", [0])
         circuit.add_gate("H", [1])
@@ -320,27 +397,78 @@ class TestQuantumGate:
 
     def test_gate_creation(self):
         """Test basic gate creation."""
-        from manim_quantum import QuantumGate
-
         gate = QuantumGate("H", [0])
         assert gate.name == "H"
         assert gate.target_wires == [0]
 
     def test_gate_with_params(self):
         """Test gate with parameters."""
-        from manim_quantum import QuantumGate
-
         gate = QuantumGate("RX", [0], params=[np.pi / 2])
         assert gate.params == [np.pi / 2]
 
+    def test_gate_label_text(self):
+        """Test the LaTeX label for plain, dagger and rotation gates."""
+        assert QuantumGate("H", [0])._get_gate_label() == "H"
+        assert QuantumGate("Sdg", [0])._get_gate_label() == r"S^{\dagger}"
+        assert QuantumGate("RX", [0], params=[np.pi / 2])._get_gate_label() == r"RX(\frac{\pi}{2})"
+        assert QuantumGate("RY", [0], params=[0.3])._get_gate_label() == "RY(0.30)"
+        assert QuantumGate("RZ", [0], params=[r"\theta"])._get_gate_label() == r"RZ(\theta)"
+
+    def test_two_qubit_gate_requires_two_wires(self):
+        """Test that two-qubit gates reject a single target wire."""
+        with pytest.raises(ValueError):
+            QuantumGate("CNOT", [0])
+
+    def test_gate_copies_target_wires(self):
+        """Test that the gate keeps its own copy of the target wires."""
+        wires = [0, 1]
+        gate = QuantumGate("SWAP", wires)
+        wires.append(2)
+        assert gate.target_wires == [0, 1]
+
+    def test_render_is_idempotent(self):
+        """Test that rendering twice at the same place reuses the visual."""
+        gate = QuantumGate("H", [0])
+        visual = gate.render(wire_positions={0: 0}, x=0)
+        assert gate.render(wire_positions={0: 0}, x=0) is visual
+        assert gate.submobjects == [visual]
+
+        moved = gate.render(wire_positions={0: 0}, x=1)
+        assert moved is not visual
+        assert gate.submobjects == [moved]
+
+        gate.invalidate()
+        assert gate.submobjects == []
+        assert gate.render(wire_positions={0: 0}, x=1) is not moved
+
+    def test_place_scaled_matches_scale_then_move(self):
+        """Test that one-pass label placement matches scale() + next_to()."""
+        expected = Square().shift(RIGHT).scale(0.5).next_to([2, 1, 0], LEFT, buff=0.2)
+        placed = place_scaled(Square().shift(RIGHT), 0.5, [1.8, 1, 0], edge=RIGHT)
+        assert np.allclose(placed.points, expected.points)
+
+    def test_gate_animation_restores_size(self):
+        """Test that the gate pulse does not compound across frames."""
+        circuit = QuantumCircuit(num_qubits=1)
+        circuit.add_gate("H", [0])
+        circuit.build()
+        gate = circuit._gates[0]
+        height = gate.get_height()
+
+        anim = GateAnimation(gate)
+        for alpha in (0.25, 0.5, 0.5, 0.75):
+            anim.interpolate_mobject(alpha)
+        assert np.isclose(gate.get_height(), height * (1 + 0.2 * np.sin(0.75 * np.pi)))
+
+        anim.interpolate_mobject(1.0)
+        assert np.isclose(gate.get_height(), height)
+
 
 class TestQuantumWire:
     """Tests for QuantumWire class."""
 
     def test_wire_creation(self):
         """Test basic wire creation."""
-        from manim_quantum import QuantumWire
-
         wire = QuantumWire(index=0, x_start=-5, x_end=5, y=0)
         assert wire.index == 0
         assert wire.x_start == -5
@@ -349,81 +477,138 @@ class TestQuantumWire:
 
     def test_wire_with_label(self):
         """Test wire with label."""
-        from manim_quantum import QuantumWire
-
         wire = QuantumWire(index=0, x_start=-5, x_end=5, y=0, label="|0\\rangle")
         assert wire.label_text == "|0\\rangle"
 
     def test_wire_masking(self):
         """Test wire region masking."""
-        from manim_quantum import QuantumWire
-
         wire = QuantumWire(index=0, x_start=-5, x_end=5, y=0)
         wire.mask_region(0, 0.3)
 
         assert len(wire._masked_regions) == 1
         assert wire._masked_regions[0] == (0, 0.3)
 
+    def test_rebuild_segments_splits_at_masks(self):
+        """Test that masked regions break the wire into visible segments."""
+        wire = QuantumWire(index=0, x_start=-5, x_end=5, y=0)
+        wire.mask_region(2, 0.5)
+        wire.mask_region(-1, 0.5)
+        wire.rebuild_segments()
+
+        assert wire._segment_spans() == [(-5, -1.5), (-0.5, 1.5), (2.5, 5)]
+        assert len(wire._line.get_subpaths()) == 3
+        assert wire.submobjects == [wire._line]
+
 
 class TestStateVector:
     """Tests for StateVector class."""
 
     def test_state_vector_creation(self, sample_amplitudes):
         """Test state vector creation."""
-        from manim_quantum import StateVector
-
         sv = StateVector(sample_amplitudes)
         assert np.allclose(sv.amplitudes, sample_amplitudes)
         assert sv.num_qubits == 2
 
+    def test_num_qubits_requires_power_of_two(self):
+        """Test that qubit count auto-detection rejects odd-sized states."""
+        assert StateVector([1]).num_qubits == 0
+        assert StateVector(np.eye(8)[3]).num_qubits == 3
+        with pytest.raises(ValueError):
+            StateVector([1, 0, 0])
+
+    def test_format_amplitudes(self):
+        """Test batch amplitude formatting against the special values."""
+        amps = np.array([1, -1 / np.sqrt(2), 0.5, -1j, 0.25, 0.3j, 0.3 - 0.4j])
+        assert StateVector._format_amplitudes(amps) == [
+            "", r"-\frac{1}{\sqrt{2}}", r"\frac{1}{2}", "-i", "0.250", "0.300i", "(0.30-0.40i)"
+        ]
+        assert StateVector._format_amplitude(1j) == "i"
+
     def test_basis_state_creation(self):
         """Test basis state creation."""
-        from manim_quantum import StateVector
-
         sv = StateVector.from_basis_state(0, num_qubits=1)
         assert sv.num_qubits == 1
         assert np.allclose(sv.amplitudes, [1, 0])
 
     def test_superposition_creation(self):
         """Test superposition state creation."""
-        from manim_quantum import StateVector
-
         sv = StateVector.superposition(num_qubits=1)
-        expected = np.array([1 / np.sqrt(2), 1 / np.sqrt(2)])
-        assert np.allclose(sv.amplitudes, expected)
+        assert np.allclose(sv.amplitudes, _PLUS_STATE)
 
     def test_bell_state_creation(self):
         """Test Bell state creation."""
-        from manim_quantum import StateVector
-
         sv = StateVector.bell_state("phi+")
-        expected = np.array([1 / np.sqrt(2), 0, 0, 1 / np.sqrt(2)])
-        assert np.allclose(sv.amplitudes, expected)
+        assert np.allclose(sv.amplitudes, _BELL_PHI_PLUS)
 
     def test_ghz_state_creation(self):
         """Test GHZ state creation."""
-        from manim_quantum import StateVector
-
         sv = StateVector.ghz_state(num_qubits=3)
         assert sv.num_qubits == 3
         assert np.isclose(abs(sv.amplitudes[0]) ** 2, 0.5)
         assert np.isclose(abs(sv.amplitudes[-1]) ** 2, 0.5)
 
+    def test_factory_states_are_independent_copies(self):
+        """Test that cached factory states are handed out as copies."""
+        StateVector.clear_cache()
+        first = StateVector.bell_state("phi+")
+        second = StateVector.bell_state("phi+")
+        assert first is not second
+        assert len(StateVector._cache) == 1
+
+        first.amplitudes[0] = 0
+        assert np.isclose(second.amplitudes[0], _INV_SQRT2)
+
+        StateVector.clear_cache()
+        assert not StateVector._cache
+
+    def test_factory_cache_is_bounded(self):
+        """Test that the factory cache evicts the least recently used state."""
+        StateVector.clear_cache()
+        StateVector.ghz_state(num_qubits=2)
+        for n in range(StateVector._cache_size):
+            StateVector.ghz_state(num_qubits=2)
+            StateVector.from_basis_state(n, num_qubits=6)
+        assert len(StateVector._cache) == StateVector._cache_size
+        assert any(key[2] == 2 for key in StateVector._cache)
+
+        StateVector.clear_cache()
+
+    def test_basis_labels(self):
+        """Test that batch basis labels match Python binary formatting."""
+        for n in (1, 3, 5):
+            indices = np.arange(2 ** n)
+            assert _basis_labels(indices, n) == [format(i, f"0{n}b") for i in indices]
+        assert _basis_labels(np.array([2, 3]), 1) == ["10", "11"]
+
+    def test_sparse_factory_states(self):
+        """Test that basis, Bell and GHZ states build without a dense amplitude vector."""
+        sv = StateVector.ghz_state(num_qubits=20)
+        assert sv._amplitudes is None
+
+        small = StateVector.from_basis_state("10", num_qubits=2)
+        assert np.allclose(small.amplitudes, [0, 0, 1, 0])
+
+        psi_minus = StateVector.bell_state("psi-")
+        assert np.allclose(psi_minus.amplitudes, [0, _INV_SQRT2, -_INV_SQRT2, 0])
+
+    def test_probability_bars_threshold(self):
+        """Test that min_probability hides bars of unlikely basis states."""
+        dense = StateVector.ghz_state(num_qubits=3, show_probabilities=True)
+        sparse = StateVector.ghz_state(num_qubits=3, show_probabilities=True, min_probability=1e-10)
+        assert len(dense.submobjects[0]) == 8
+        assert len(sparse.submobjects[0]) == 2
+
 
 class TestKetLabel:
     """Tests for KetLabel class."""
 
     def test_ket_creation(self):
         """Test ket label creation."""
-        from manim_quantum import KetLabel
-
         ket = KetLabel("0")
         assert ket.content == "0"
 
     def test_ket_basis(self):
         """Test ket basis creation."""
-        from manim_quantum import KetLabel
-
         ket = KetLabel.basis(0, num_qubits=2)
         assert ket.content == "00"
 
@@ -433,8 +618,6 @@ class TestBlochSphere:
 
     def test_bloch_sphere_creation(self):
         """Test Bloch sphere creation."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere()
         assert sphere.radius == 2.0
         assert sphere.get_theta() == 0.0
@@ -442,34 +625,72 @@ class TestBlochSphere:
 
     def test_bloch_sphere_with_initial_state(self):
         """Test Bloch sphere with initial state."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere(initial_state=(np.pi / 2, 0))
         assert np.isclose(sphere.get_theta(), np.pi / 2)
         assert np.isclose(sphere.get_phi(), 0)
 
     def test_basis_state_creation(self):
         """Test basis state Bloch sphere."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere.basis_state("0")
         assert sphere.get_theta() == 0
 
         sphere = BlochSphere.basis_state("1")
         assert np.isclose(sphere.get_theta(), np.pi)
 
+    def test_sphere_surface_lies_on_radius(self):
+        """Test that the vectorized sphere surface samples lie on the sphere."""
+        sphere = BlochSphere(radius=1.5)
+        anchors = np.concatenate(
+            [face.get_anchors() for face in sphere.sphere.family_members_with_points()]
+        )
+        assert np.allclose(np.linalg.norm(anchors, axis=1), 1.5)
+
+    def test_sphere_surface_without_vmobject_internals(self, monkeypatch):
+        """Test that the sphere surface falls back to per-point mapping."""
+        monkeypatch.setattr("manim_quantum.bloch.sphere._VECTORIZED_UV_MAPPING", False)
+        sphere = BlochSphere(radius=2.0, sphere_resolution=(8, 4), show_labels=False)
+        anchors = np.concatenate(
+            [face.get_anchors() for face in sphere.sphere.family_members_with_points()]
+        )
+        assert np.allclose(np.linalg.norm(anchors, axis=1), 2.0)
+
+    def test_sphere_resolution(self):
+        """Test that the sphere surface resolution is configurable."""
+        sphere = BlochSphere(sphere_resolution=(8, 4), show_labels=False)
+        assert len(sphere.sphere.submobjects) == 8 * 4
+
+    def test_state_factories_return_independent_copies(self):
+        """Test that cached state factories return independent spheres."""
+        first = BlochSphere.plus_state()
+        second = BlochSphere.minus_state()
+        assert first.state_arrow is not second.state_arrow
+
+        second.set_state(0, 0)
+        assert np.isclose(first.get_theta(), np.pi / 2)
+        assert np.allclose(first.state_arrow.get_end(), [first.radius, 0, 0], atol=1e-6)
+
+    def test_state_factories_reject_initial_state(self):
+        """Test that state factories do not silently override initial_state."""
+        with pytest.raises(TypeError, match="initial_state"):
+            BlochSphere.plus_state(initial_state=(0, 0))
+
+    def test_state_factory_prototypes_are_bounded(self, monkeypatch):
+        """Test that the factory prototypes evict the least recently used sphere."""
+        monkeypatch.setattr(BlochSphere, "_prototypes", type(BlochSphere._prototypes)())
+        monkeypatch.setattr(BlochSphere, "_prototypes_size", 2)
+        for radius in (1.0, 2.0, 1.0, 3.0):
+            BlochSphere.plus_state(radius=radius, show_labels=False, sphere_resolution=(4, 2))
+        radii = [dict(key[1])["radius"] for key in BlochSphere._prototypes]
+        assert radii == ["1.0", "3.0"]
+
     def test_plus_state(self):
         """Test |+⟩ state Bloch sphere."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere.plus_state()
         assert np.isclose(sphere.get_theta(), np.pi / 2)
         assert np.isclose(sphere.get_phi(), 0)
 
     def test_set_state(self):
         """Test setting Bloch sphere state."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere()
         sphere.set_state(np.pi / 4, np.pi / 3)
 
@@ -478,8 +699,6 @@ class TestBlochSphere:
 
     def test_get_state_amplitudes(self):
         """Test getting state amplitudes."""
-        from manim_quantum import BlochSphere
-
         # |0⟩ state
         sphere = BlochSphere.basis_state("0")
         alpha, beta = sphere.get_state_amplitudes()
@@ -488,8 +707,6 @@ class TestBlochSphere:
 
     def test_set_state_updates_arrow_in_place(self):
         """Test that set_state updates arrow without recreating it."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere()
         original_arrow = sphere.state_arrow
 
@@ -501,17 +718,32 @@ class TestBlochSphere:
         assert np.isclose(sphere.get_theta(), np.pi / 2)
         assert np.isclose(sphere.get_phi(), np.pi / 4)
 
+    def test_set_state_flips_arrow_between_poles(self):
+        """Test that the arrow follows a direct |0⟩ to |1⟩ state change."""
+        sphere = BlochSphere(radius=2.0)
+        sphere.set_state(np.pi, 0)
+
+        assert np.allclose(sphere.state_arrow.get_end(), [0, 0, -2.0], atol=1e-6)
+
+    def test_amplitudes_to_angles_matches_scalar_path(self):
+        """Test that the vectorized conversion agrees with set_state_from_amplitudes."""
+        alphas = np.array([1, 0, _INV_SQRT2, 0.6, 0], dtype=complex)
+        betas = np.array([0, 1j, 1j * _INV_SQRT2, -0.8, 0], dtype=complex)
+        thetas, phis = BlochSphere.amplitudes_to_angles(alphas, betas)
+
+        sphere = BlochSphere(show_labels=False)
+        for alpha, beta, theta, phi in zip(alphas, betas, thetas, phis):
+            sphere.set_state_from_amplitudes(alpha, beta)
+            assert np.isclose(sphere.get_theta(), theta)
+            assert np.isclose(sphere.get_phi(), phi)
+
     def test_get_theta(self):
         """Test get_theta method."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere(initial_state=(np.pi / 3, np.pi / 4))
         assert np.isclose(sphere.get_theta(), np.pi / 3)
 
     def test_get_phi(self):
         """Test get_phi method."""
-        from manim_quantum import BlochSphere
-
         sphere = BlochSphere(initial_state=(np.pi / 3, np.pi / 4))
         assert np.isclose(sphere.get_phi(), np.pi / 4)
 
@@ -521,51 +753,61 @@ class TestQuantumStyle:
 
     def test_default_style(self):
         """Test default style creation."""
-        from manim_quantum.styles import QuantumStyle
-
         style = QuantumStyle()
         assert style.gate_width == 0.6
         assert style.wire_stroke_width == 2.0
 
     def test_custom_style(self):
         """Test custom style creation."""
-        from manim_quantum.styles import QuantumStyle
-
         style = QuantumStyle(gate_width=0.8, wire_color="#FF0000")
         assert style.gate_width == 0.8
         assert style.wire_color == "#FF0000"
 
+    def test_style_is_immutable(self):
+        """Test that styles are frozen and derived with dataclasses.replace."""
+        style = QuantumStyle()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            style.gate_width = 1.0
 
-class TestStylePresets:
-    """Tests for StylePresets class."""
-
-    def test_ibm_preset(self):
-        """Test IBM style preset."""
-        from manim_quantum.styles import StylePresets
-
-        style = StylePresets.ibm()
-        assert style.gate_fill_color == "#6929C4"
-
-    def test_google_preset(self):
-        """Test Google style preset."""
-        from manim_quantum.styles import StylePresets
-
-        style = StylePresets.google()
-        assert style.gate_fill_color == "#4285F4"
-
-    def test_dark_preset(self):
-        """Test dark style preset."""
-        from manim_quantum.styles import StylePresets
+        wide = dataclasses.replace(style, gate_width=1.0)
+        assert wide.gate_width == 1.0
+        assert style.gate_width == 0.6
+        assert not hasattr(style, "__dict__")
 
-        style = StylePresets.dark()
-        assert style.gate_fill_color == "#1E1E2E"
 
-    def test_light_preset(self):
-        """Test light style preset."""
-        from manim_quantum.styles import StylePresets
+class TestStylePresets:
+    """Tests for StylePresets class."""
 
-        style = StylePresets.light()
-        assert style.gate_fill_color == "#FFFFFF"
+    @pytest.mark.parametrize(
+        ("preset", "expected"),
+        [
+            ("ibm", "#6929C4"),
+            ("google", "#4285F4"),
+            ("dark", "#1E1E2E"),
+            ("light", "#FFFFFF"),
+        ],
+    )
+    def test_preset_gate_fill(self, preset, expected):
+        """Test the gate fill color of each named preset."""
+        style = getattr(StylePresets, preset)()
+        assert style.gate_fill_color == expected
+
+    def test_presets_are_cached(self):
+        """Test that presets are built once and reused."""
+        assert StylePresets.ibm() is StylePresets.ibm()
+        assert StylePresets.default() is not StylePresets.ibm()
+
+    def test_get_preset_by_name(self):
+        """Test looking up presets by name."""
+        assert StylePresets.get("ibm") is StylePresets.ibm()
+        assert StylePresets.get("default") is StylePresets.default()
+        with pytest.raises(ValueError):
+            StylePresets.get("neon")
+
+    def test_components_share_default_style(self):
+        """Test that components without a style use the shared default preset."""
+        assert KetLabel("0").style is StylePresets.default()
+        assert QuantumGate("H", [0]).style is StylePresets.default()
 
 
 class TestCircuitEvaluationAnimation:
@@ -573,8 +815,6 @@ class TestCircuitEvaluationAnimation:
 
     def test_animation_creation(self):
         """Test basic animation factory creation."""
-        from manim_quantum import CircuitEvaluationAnimation, QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2)
         circuit.add_gate("H", [0])
         circuit.build()
@@ -584,8 +824,6 @@ class TestCircuitEvaluationAnimation:
 
     def test_glow_animation(self):
         """Test glow animation creation."""
-        from manim_quantum import CircuitEvaluationAnimation, QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2)
         circuit.add_gate("H", [0])
         circuit.build()
@@ -594,10 +832,20 @@ class TestCircuitEvaluationAnimation:
         anim = anim_factory.create_glow_animation()
         assert anim is not None
 
+    def test_glow_animations_keep_their_colors(self):
+        """Test that glows created one after another keep separate colors."""
+        circuit = QuantumCircuit(num_qubits=2)
+        anim_factory = CircuitEvaluationAnimation(circuit)
+
+        red = anim_factory.create_glow_animation(color=RED)
+        blue = anim_factory.create_glow_animation(color=BLUE)
+
+        assert red.mobject is not blue.mobject
+        assert all(line.get_stroke_color().to_hex() == RED.to_hex() for line in red.mobject)
+        assert all(line.get_stroke_color().to_hex() == BLUE.to_hex() for line in blue.mobject)
+
     def test_shot_animation(self):
         """Test shot animation creation."""
-        from manim_quantum import CircuitEvaluationAnimation, QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=2)
         circuit.add_gate("H", [0])
         circuit.build()
@@ -606,10 +854,20 @@ class TestCircuitEvaluationAnimation:
         anim = anim_factory.create_shot_animation()
         assert anim is not None
 
+    def test_shot_animation_moves_packets(self):
+        """Test that the shot animation moves one packet per wire along the wire."""
+        circuit = QuantumCircuit(num_qubits=2, x_start=-4, x_end=4)
+        circuit.build()
+
+        anim = CircuitEvaluationAnimation(circuit).create_shot_animation()
+        assert len(anim.mobject.submobjects) == 2
+
+        anim.interpolate_mobject(0.5)
+        for packet, wire in zip(anim.mobject.submobjects, circuit._wires.values()):
+            assert np.allclose(packet.get_center(), [0, wire.y, 0])
+
     def test_animation_with_specific_wires(self):
         """Test animations can be limited to specific wires."""
-        from manim_quantum import CircuitEvaluationAnimation, QuantumCircuit
-
         circuit = QuantumCircuit(num_qubits=3)
         circuit.add_gate("H", [0])
         circuit.add_gate("H", [1])
@@ -630,8 +888,6 @@ class TestBlochSphereAnimations:
 
     def test_state_transition_creation(self):
         """Test BlochSphereStateTransition creation."""
-        from manim_quantum import BlochSphere, BlochSphereStateTransition
-
         sphere = BlochSphere.basis_state("0")
         anim = BlochSphereStateTransition(sphere, np.pi / 2, 0)
 
@@ -643,8 +899,6 @@ class TestBlochSphereAnimations:
 
     def test_state_transition_interpolation(self):
         """Test BlochSphereStateTransition interpolation."""
-        from manim_quantum import BlochSphere, BlochSphereStateTransition
-
         sphere = BlochSphere.basis_state("0")
         anim = BlochSphereStateTransition(sphere, np.pi, 0)
 
@@ -658,10 +912,31 @@ class TestBlochSphereAnimations:
         assert np.isclose(sphere.get_theta(), np.pi)
         assert np.isclose(sphere.get_phi(), 0)
 
+    def test_state_transition_angles_match_interpolation(self):
+        """Test that the vectorized path agrees with interpolate_mobject()."""
+        for target in [(np.pi / 2, np.pi / 2), (np.pi, 0)]:
+            sphere = BlochSphere(initial_state=(np.pi / 3, 0.2), show_labels=False)
+            anim = BlochSphereStateTransition(sphere, *target)
+            alphas = np.linspace(0, 1, 7)
+            thetas, phis = anim.angles_at(alphas)
+
+            for alpha, theta, phi in zip(alphas, thetas, phis):
+                anim.interpolate_mobject(alpha)
+                assert np.isclose(sphere.get_theta(), theta)
+                assert np.isclose(sphere.get_phi(), phi)
+
+    def test_state_transition_follows_great_circle(self):
+        """Test that the transition moves along the great circle between states."""
+        # |+⟩ to |+i⟩ runs along the equator
+        sphere = BlochSphere.plus_state()
+        anim = BlochSphereStateTransition(sphere, np.pi / 2, np.pi / 2)
+
+        anim.interpolate_mobject(0.5)
+        assert np.isclose(sphere.get_theta(), np.pi / 2)
+        assert np.isclose(sphere.get_phi(), np.pi / 4)
+
     def test_rotation_animation_creation(self):
         """Test BlochSphereRotation creation."""
-        from manim_quantum import BlochSphere, BlochSphereRotation
-
         sphere = BlochSphere.basis_state("0")
         anim = BlochSphereRotation(sphere, "y", np.pi / 2)
 
@@ -671,8 +946,6 @@ class TestBlochSphereAnimations:
 
     def test_rotation_around_y_axis(self):
         """Test rotation around Y axis."""
-        from manim_quantum import BlochSphere, BlochSphereRotation
-
         # Start at |0⟩ (north pole)
         sphere = BlochSphere.basis_state("0")
         anim = BlochSphereRotation(sphere, "y", np.pi / 2)
@@ -683,8 +956,6 @@ class TestBlochSphereAnimations:
 
     def test_rotation_around_x_axis(self):
         """Test rotation around X axis."""
-        from manim_quantum import BlochSphere, BlochSphereRotation
-
         sphere = BlochSphere.basis_state("0")
         anim = BlochSphereRotation(sphere, "x", np.pi / 2)
 
@@ -695,8 +966,6 @@ class TestBlochSphereAnimations:
 
     def test_rotation_around_z_axis(self):
         """Test rotation around Z axis."""
-        from manim_quantum import BlochSphere, BlochSphereRotation
-
         # Start at |+⟩ (on equator at phi=0)
         sphere = BlochSphere.plus_state()
         anim = BlochSphereRotation(sphere, "z", np.pi / 2)
@@ -709,12 +978,75 @@ class TestBlochSphereAnimations:
         # Phi should have rotated
         assert np.isclose(sphere.get_phi(), initial_phi + np.pi / 2, atol=1e-6)
 
+    def test_rotation_around_z_axis_keeps_latitude(self):
+        """Test that a Z rotation keeps theta constant during the animation."""
+        sphere = BlochSphere(initial_state=(np.pi / 3, 0))
+        anim = BlochSphereRotation(sphere, "z", np.pi)
+
+        anim.interpolate_mobject(0.5)
+        assert np.isclose(sphere.get_theta(), np.pi / 3)
+        assert np.isclose(sphere.get_phi(), np.pi / 2)
+
     def test_rotation_invalid_axis(self):
         """Test that invalid axis raises error."""
-        from manim_quantum import BlochSphere, BlochSphereRotation
-        import pytest
-
         sphere = BlochSphere.basis_state("0")
 
         with pytest.raises(ValueError, match="Invalid axis"):
             BlochSphereRotation(sphere, "w", np.pi / 2)
+
+
+class TestPennyLaneConverter:
+    """Tests for the PennyLane QNode converter."""
+
+    def test_parameter_binding_ignores_coinciding_constants(self):
+        """Test that only gates taking an argument directly are bound to it."""
+        qml = pytest.importorskip("pennylane")
+        dev = qml.device("default.qubit", wires=3)
+
+        @qml.qnode(dev)
+        def qnode(theta):
+            qml.RY(theta, wires=0)
+            qml.RZ(0.5, wires=1)
+            qml.RX(2 * theta, wires=2)
+            return qml.expval(qml.PauliZ(0))
+
+        with pytest.warns(UserWarning, match="computed from QNode arguments"):
+            circuit = circuit_from_qnode(qnode, 0.5)
+
+        assert [gate.param_name for gate in circuit._gates[:3]] == ["theta", None, None]
+        circuit.set_parameter("theta", 1.0)
+        assert circuit._gates[1].params == [0.5]
+
+    def test_cache_hit_skips_parameter_probing(self, monkeypatch):
+        """Test that converting the same QNode again records the tape only once."""
+        qml = pytest.importorskip("pennylane")
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def qnode(theta, phi):
+            qml.RY(theta, wires=0)
+            qml.RZ(phi, wires=1)
+            return qml.expval(qml.PauliZ(0))
+
+        clear_circuit_cache()
+        first = circuit_from_qnode(qnode, 0.5, 0.7)
+        calls = []
+        construct = qnode.construct
+        monkeypatch.setattr(qnode, "construct", lambda *a: calls.append(a) or construct(*a))
+        second = circuit_from_qnode(qnode, 0.5, 0.7)
+
+        assert len(calls) == 1
+        assert second is not first
+        assert [gate.param_name for gate in second._gates[:2]] == ["theta", "phi"]
+        clear_circuit_cache()
+
+
+class TestPackage:
+    """Tests for the package namespace."""
+
+    def test_lazy_exports(self):
+        """Test that public names resolve to their subpackage objects."""
+        assert manim_quantum.QuantumCircuit is manim_quantum.circuits.QuantumCircuit
+        assert set(manim_quantum.__all__) <= set(dir(manim_quantum))
+        with pytest.raises(AttributeError):
+            manim_quantum.NotAThing